@@ -1,39 +1,50 @@
 """
 Resume tailoring endpoints - generates styled PDFs matching original resume format
 """
-from fastapi import APIRouter, HTTPException, Depends
-import base64
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+import asyncio
 import httpx
+from concurrent.futures.process import BrokenProcessPool
 from app.models.schemas import TailorCVRequest, TailorCVResponse
 from app.models.resume import ResumeData
 from app.services.resume_loader import load_resume_from_yaml
 from app.services.resume_tailor_service import tailor_resume_content, generate_cover_letter
 from app.services.resume_pdf_service import generate_styled_resume_pdf
 from app.services.pdf_service import generate_pdf_from_text
+from app.services.pdf_store import store_pdfs, get_pdf
 from app.api.deps import get_groq_key_manager
-from app.core.api_key_manager import GroqAPIKeyManager
+from app.core.executors import get_pdf_executor, discard_pdf_executor
+from app.core.api_key_manager import GroqAPIKeyManager, RATE_LIMIT_RE, RATE_LIMIT_STATUS_CODES
 from app.core.logging import get_logger
 
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Transient network errors worth retrying with the next API key
+_RETRYABLE_ERRORS = (httpx.ConnectError, httpx.RemoteProtocolError)
+
+# Divider under section headings in the plain text resume
+_SECTION_RULE = "-" * 40
+
 
 @router.post("/tailor-cv", response_model=TailorCVResponse)
 async def tailor_cv(
     request: TailorCVRequest,
+    http_request: Request,
     key_manager: GroqAPIKeyManager = Depends(get_groq_key_manager)
 ):
     """
     Tailor a CV and generate a cover letter for a job using Groq AI.
-    Returns styled PDF matching user's original resume format.
+    Generates styled PDFs matching user's original resume format.
     
     Args:
         request: CV tailoring request with job details
+        http_request: Incoming HTTP request, used to build download paths
         key_manager: API key manager dependency
         
     Returns:
-        Tailored CV and cover letter as PDFs and text
+        Tailored CV and cover letter as text, with download URLs for the PDFs
     """
     
     if not key_manager.api_keys:
@@ -42,9 +53,12 @@ async def tailor_cv(
             detail="No Groq API keys configured. Set GROQ_API_KEYS environment variable."
         )
     
-    # Load base resume from YAML
+    title = request.title
+    cover_letter_title = "CoverLetter_" + title
+    
+    # Load base resume from YAML (file I/O and YAML parsing run in a worker thread)
     try:
-        base_resume = load_resume_from_yaml()
+        base_resume = await asyncio.to_thread(load_resume_from_yaml)
     except FileNotFoundError as e:
         raise HTTPException(
             status_code=500,
@@ -56,6 +70,10 @@ async def tailor_cv(
             detail=f"Invalid resume template: {str(e)}"
         )
     
+    # Both prompts embed the same resume; serialize it once, compactly
+    # (indentation only costs prompt tokens)
+    resume_json = base_resume.model_dump_json()
+    
     # Try each available API key
     max_retries = len(key_manager.api_keys)
     last_error = None
@@ -69,69 +87,78 @@ async def tailor_cv(
                 detail="All API keys are currently unavailable. Please try again later."
             )
         
+        key_label = key_manager.labels[api_key]
+        
         try:
-            logger.info(f"Attempt {attempt + 1}/{max_retries} - Using API key: {api_key[:10]}...")
+            logger.info("Attempt %d/%d - Using API key: %s", attempt + 1, max_retries, key_label)
             
-            # Tailor resume content using AI
-            tailored_resume = await tailor_resume_content(
-                resume_data=base_resume,
-                job_title=request.title,
-                company=request.company,
-                description=request.description,
-                api_key=api_key
-            )
+            # Tailor resume content and generate the cover letter concurrently;
+            # both are written from the base resume, so neither waits on the other
+            ai_tasks = [
+                asyncio.create_task(tailor_resume_content(
+                    resume_json=resume_json,
+                    job_title=title,
+                    company=request.company,
+                    description=request.description,
+                    api_key=api_key
+                )),
+                asyncio.create_task(generate_cover_letter(
+                    resume_json=resume_json,
+                    job_title=title,
+                    company=request.company,
+                    description=request.description,
+                    api_key=api_key
+                ))
+            ]
+            try:
+                tailored_resume, cover_letter = await asyncio.gather(*ai_tasks)
+            finally:
+                # If one call failed, don't keep spending tokens on the other,
+                # and collect its outcome so no task exception goes unretrieved
+                for task in ai_tasks:
+                    task.cancel()
+                await asyncio.gather(*ai_tasks, return_exceptions=True)
             
-            # Generate cover letter
-            cover_letter = await generate_cover_letter(
-                resume_data=tailored_resume,
-                job_title=request.title,
-                company=request.company,
-                description=request.description,
-                api_key=api_key
-            )
-            
-            # Generate styled resume PDF
-            logger.info("Generating styled resume PDF...")
-            cv_pdf_buffer = generate_styled_resume_pdf(tailored_resume)
-            
-            # Generate cover letter PDF (using existing simple PDF service)
-            logger.info("Generating cover letter PDF...")
-            cl_pdf_buffer = generate_pdf_from_text(cover_letter, f"CoverLetter_{request.title}")
-            
-            # Convert to base64
-            cv_pdf_base64 = base64.b64encode(cv_pdf_buffer.read()).decode('utf-8')
-            cl_pdf_base64 = base64.b64encode(cl_pdf_buffer.read()).decode('utf-8')
+            logger.info("Generating styled resume and cover letter PDFs...")
+            cv_pdf_bytes, cl_pdf_bytes = await _render_pdfs(tailored_resume, cover_letter, cover_letter_title)
             
             # Generate text version of CV for response
             cv_text = _resume_to_text(tailored_resume)
             
-            logger.info(f"Successfully completed all tasks using API key: {api_key[:10]}...")
+            logger.info("Successfully completed all tasks using API key: %s", key_label)
             
-            return TailorCVResponse(
+            # Keep the PDFs for download instead of base64-encoding them into the JSON
+            pdf_id = store_pdfs(cv_pdf_bytes, cl_pdf_bytes)
+            
+            # All fields are built here, so skip input validation
+            response = TailorCVResponse.model_construct(
                 success=True,
-                cv_pdf=cv_pdf_base64,
-                cover_letter_pdf=cl_pdf_base64,
+                cv_pdf_url=_download_path(http_request, "download_cv_pdf", pdf_id),
+                cover_letter_pdf_url=_download_path(http_request, "download_cover_letter_pdf", pdf_id),
                 cv_text=cv_text,
                 cover_letter_text=cover_letter,
-                job_title=request.title,
+                job_title=title,
                 company=request.company,
                 url=request.url,
-                api_key_used=api_key[:10] + "...",
+                api_key_used=key_label,
                 attempt=attempt + 1,
                 message="Styled CV and Cover Letter PDFs generated successfully"
             )
+            
+            # Serialize with pydantic-core directly; returning a Response also
+            # skips FastAPI's response_model validation
+            return Response(content=response.model_dump_json(), media_type="application/json")
         
         except HTTPException as e:
             # Check if it's a rate limit or quota error
-            if e.status_code in [429, 403]:
-                logger.warning(f"Rate limit/quota error for API key: {api_key[:10]}...")
+            if e.status_code in RATE_LIMIT_STATUS_CODES:
+                logger.warning("Rate limit/quota error for API key: %s", key_label)
                 key_manager.mark_key_failed(api_key)
                 last_error = e.detail
                 continue
             
             # Check error message for rate limit indicators
-            error_detail = str(e.detail).lower()
-            if any(keyword in error_detail for keyword in ["rate", "quota", "limit"]):
+            if RATE_LIMIT_RE.search(str(e.detail)):
                 key_manager.mark_key_failed(api_key)
                 last_error = e.detail
                 continue
@@ -140,14 +167,19 @@ async def tailor_cv(
             raise
         
         except httpx.TimeoutException:
-            logger.error(f"Timeout with API key: {api_key[:10]}...")
+            logger.error("Timeout with API key: %s", key_label)
             last_error = "Request timeout"
             continue
         
-        except Exception as e:
-            logger.error(f"Error with API key {api_key[:10]}...: {str(e)}")
+        except _RETRYABLE_ERRORS as e:
+            logger.error("Network error with API key %s: %s", key_label, e)
             last_error = str(e)
             continue
+        
+        except Exception as e:
+            # Not a key or network problem, so another key would fail the same way
+            logger.error("Error with API key %s: %s", key_label, e)
+            raise HTTPException(status_code=500, detail=str(e))
     
     # All retries failed
     raise HTTPException(
@@ -156,63 +188,152 @@ async def tailor_cv(
     )
 
 
+async def _render_pdfs(resume: ResumeData, cover_letter: str, cover_letter_title: str) -> tuple[bytes, bytes]:
+    """
+    Render the resume and cover letter PDFs in parallel in the PDF process pool
+    
+    ReportLab rendering is CPU-bound pure Python, so it runs in worker
+    processes. A pool broken by a dead worker is replaced and the render
+    retried once.
+    
+    Args:
+        resume: Tailored resume
+        cover_letter: Cover letter text
+        cover_letter_title: Title of the cover letter PDF
+        
+    Returns:
+        Tuple of (resume PDF bytes, cover letter PDF bytes)
+    """
+    loop = asyncio.get_running_loop()
+    
+    for attempt in range(2):
+        pdf_executor = get_pdf_executor()
+        try:
+            return await asyncio.gather(
+                loop.run_in_executor(pdf_executor, generate_styled_resume_pdf, resume),
+                loop.run_in_executor(pdf_executor, generate_pdf_from_text, cover_letter, cover_letter_title)
+            )
+        except BrokenProcessPool:
+            discard_pdf_executor(pdf_executor)
+            if attempt:
+                raise
+            logger.warning("PDF process pool is broken, restarting it")
+
+
+@router.get("/tailor-cv/{pdf_id}/cv.pdf", name="download_cv_pdf")
+async def download_cv_pdf(pdf_id: str):
+    """
+    Download a CV PDF generated by /tailor-cv
+    
+    Args:
+        pdf_id: Id from the /tailor-cv download URL
+        
+    Returns:
+        The PDF file
+    """
+    return _pdf_response(pdf_id, "cv", "CV.pdf")
+
+
+@router.get("/tailor-cv/{pdf_id}/cover-letter.pdf", name="download_cover_letter_pdf")
+async def download_cover_letter_pdf(pdf_id: str):
+    """
+    Download a cover letter PDF generated by /tailor-cv
+    
+    Args:
+        pdf_id: Id from the /tailor-cv download URL
+        
+    Returns:
+        The PDF file
+    """
+    return _pdf_response(pdf_id, "cover_letter", "CoverLetter.pdf")
+
+
+def _download_path(http_request: Request, route_name: str, pdf_id: str) -> str:
+    """
+    Root-relative path of a PDF download route
+    
+    Absolute URLs would use the scheme the app sees, which is http:// behind
+    a TLS-terminating proxy, so clients resolve the path against the API host.
+    """
+    return http_request.scope.get("root_path", "") + http_request.app.url_path_for(route_name, pdf_id=pdf_id)
+
+
+def _pdf_response(pdf_id: str, kind: str, filename: str) -> Response:
+    """Build the download response for a stored PDF"""
+    pdf = get_pdf(pdf_id, kind)
+    if pdf is None:
+        raise HTTPException(
+            status_code=404,
+            detail="PDF not found or expired. Call /tailor-cv again to regenerate it."
+        )
+    
+    return Response(
+        content=pdf,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 def _resume_to_text(resume: ResumeData) -> str:
     """Convert ResumeData to plain text format for API response"""
-    lines = []
-    
+    return "\n".join(_iter_resume_lines(resume))
+
+
+def _iter_resume_lines(resume: ResumeData):
+    """Yield the plain text lines of a resume"""
     # Personal info
-    lines.append(resume.personal.name)
-    if resume.personal.portfolio:
-        lines.append(f"Portfolio: {resume.personal.portfolio}")
-    lines.append(f"Email: {resume.personal.email}")
-    lines.append(f"Phone: {resume.personal.phone}")
-    if resume.personal.linkedin:
-        lines.append(f"LinkedIn: {resume.personal.linkedin}")
-    lines.append("")
+    personal = resume.personal
+    yield personal.name
+    if personal.portfolio:
+        yield "Portfolio: " + personal.portfolio
+    yield "Email: " + personal.email
+    yield "Phone: " + personal.phone
+    if personal.linkedin:
+        yield "LinkedIn: " + personal.linkedin
+    yield ""
     
     # Summary
-    lines.append(resume.summary)
-    lines.append("")
+    yield resume.summary
+    yield ""
     
     # Employment
-    lines.append("EMPLOYMENT HISTORY")
-    lines.append("-" * 40)
+    yield "EMPLOYMENT HISTORY"
+    yield _SECTION_RULE
     for emp in resume.employment:
-        lines.append(f"{emp.position}, {emp.company}")
-        lines.append(f"Duration: {emp.duration}")
+        yield f"{emp.position}, {emp.company}"
+        yield "Duration: " + emp.duration
         if emp.technologies:
-            lines.append(f"Technologies: {emp.technologies}")
+            yield "Technologies: " + emp.technologies
         for role in emp.roles:
-            lines.append(f"  {role.title}:")
+            yield f"  {role.title}:"
             for bullet in role.bullets:
-                lines.append(f"    - {bullet}")
-        lines.append("")
+                yield "    - " + bullet
+        yield ""
     
     # Projects
-    lines.append("PROJECTS")
-    lines.append("-" * 40)
+    yield "PROJECTS"
+    yield _SECTION_RULE
     for project in resume.projects:
-        title = project.name
         if project.url:
-            title += f" | {project.url}"
-        lines.append(title)
+            yield f"{project.name} | {project.url}"
+        else:
+            yield project.name
         for bullet in project.bullets:
-            lines.append(f"  - {bullet}")
-        lines.append("")
+            yield "  - " + bullet
+        yield ""
     
     # Skills
-    lines.append("SKILLS")
-    lines.append("-" * 40)
-    lines.append(resume.skills)
-    lines.append("")
+    yield "SKILLS"
+    yield _SECTION_RULE
+    yield resume.skills
+    yield ""
     
     # Education
-    lines.append("EDUCATION")
-    lines.append("-" * 40)
-    lines.append(f"{resume.education.degree}, {resume.education.institution}")
-    edu_text = resume.education.duration
-    if resume.education.cgpa:
-        edu_text += f" | CGPA - {resume.education.cgpa}"
-    lines.append(edu_text)
-    
-    return "\n".join(lines)
+    education = resume.education
+    yield "EDUCATION"
+    yield _SECTION_RULE
+    yield f"{education.degree}, {education.institution}"
+    if education.cgpa:
+        yield f"{education.duration} | CGPA - {education.cgpa}"
+    else:
+        yield education.duration
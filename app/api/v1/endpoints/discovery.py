@@ -9,12 +9,15 @@ from app.models.discovery import (
 )
 from app.services.discovery_service import discover_jobs
 from app.api.deps import get_groq_key_manager
-from app.core.api_key_manager import GroqAPIKeyManager
+from app.core.api_key_manager import GroqAPIKeyManager, RATE_LIMIT_RE, RATE_LIMIT_STATUS_CODES
 from app.core.logging import get_logger
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Maximum number of API keys to try for a single discovery request
+MAX_DISCOVERY_ATTEMPTS = 3
+
 
 @router.post("/discover", response_model=DiscoverJobsResponse)
 async def discover_jobs_endpoint(
@@ -38,31 +41,49 @@ async def discover_jobs_endpoint(
     - Finding jobs at startups and companies not on major job boards
     - Discovering opportunities on Greenhouse, Lever, and direct career pages
     """
-    logger.info(f"Discovery request: {request.role} in {request.location}")
+    logger.info("Discovery request: %s in %s", request.role, request.location)
     
-    # Get available API key
-    api_key = key_manager.get_available_key()
-    if not api_key:
-        raise HTTPException(
-            status_code=503,
-            detail="No API keys available. Please try again later."
-        )
+    # Try up to a few keys so a rate-limited key doesn't fail the whole discovery
+    max_attempts = min(MAX_DISCOVERY_ATTEMPTS, len(key_manager.api_keys)) or 1
+    last_error = None
     
-    try:
-        jobs, queries_used, sources_crawled, errors = await discover_jobs(
-            request=request,
-            api_key=api_key
-        )
-        
-        return DiscoverJobsResponse(
-            jobs=jobs,
-            count=len(jobs),
-            search_queries_used=queries_used,
-            sources_crawled=sources_crawled,
-            errors=errors
-        )
+    for attempt in range(max_attempts):
+        api_key = key_manager.get_available_key()
+        if not api_key:
+            raise HTTPException(
+                status_code=503,
+                detail="No API keys available. Please try again later."
+            )
         
-    except Exception as e:
-        logger.error(f"Discovery error: {e}")
-        key_manager.mark_key_failed(api_key)
-        raise HTTPException(status_code=500, detail=str(e))
+        try:
+            jobs, queries_used, sources_crawled, errors = await discover_jobs(
+                request=request,
+                api_key=api_key
+            )
+            
+            return DiscoverJobsResponse(
+                jobs=jobs,
+                count=len(jobs),
+                search_queries_used=queries_used,
+                sources_crawled=sources_crawled,
+                errors=errors
+            )
+            
+        except Exception as e:
+            key_manager.mark_key_failed(api_key)
+            
+            is_rate_limit = (
+                isinstance(e, HTTPException) and e.status_code in RATE_LIMIT_STATUS_CODES
+            ) or RATE_LIMIT_RE.search(str(e))
+            if is_rate_limit:
+                logger.warning("Rate limit error on attempt %d/%d: %s", attempt + 1, max_attempts, e)
+                last_error = str(e)
+                continue
+            
+            logger.error("Discovery error: %s", e)
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    raise HTTPException(
+        status_code=503,
+        detail=f"Discovery failed after {max_attempts} attempts. Last error: {last_error}"
+    )
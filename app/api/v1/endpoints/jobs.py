@@ -1,7 +1,7 @@
 """
 Job scraping endpoints
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from app.models.schemas import JobSearchRequest, JobSearchResponse
 from app.services.job_service import scrape_job_listings
 
@@ -32,10 +32,11 @@ def scrape_jobs_endpoint(request: JobSearchRequest):
             experience_level=request.experience_level
         )
 
-        return {
-            "jobs": jobs_list,
-            "count": len(jobs_list)
-        }
+        response = JobSearchResponse(jobs=jobs_list, count=len(jobs_list))
+
+        # Serialize with pydantic-core directly instead of jsonable_encoder;
+        # it writes dates as ISO strings and NaN/infinity as null
+        return Response(content=response.model_dump_json(), media_type="application/json")
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
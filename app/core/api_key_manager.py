@@ -1,13 +1,22 @@
 """
 Groq API Key Manager with automatic failover on rate limits
 """
-from datetime import datetime, timedelta
+import heapq
+import re
+import time
+from collections import deque
 from typing import Optional, List
 from app.core.logging import get_logger
 
 
 logger = get_logger(__name__)
 
+# Keywords in an error message that indicate a rate limit or quota error
+RATE_LIMIT_RE = re.compile(r"rate|quota|limit", re.IGNORECASE)
+
+# Groq status codes for rate limits, exhausted quota and overload
+RATE_LIMIT_STATUS_CODES = frozenset({429, 403, 503})
+
 
 class GroqAPIKeyManager:
     """Manages multiple Groq API keys with automatic failover on rate limits"""
@@ -21,64 +30,85 @@ class GroqAPIKeyManager:
             cooldown_minutes: Cooldown period for failed keys
         """
         self.api_keys = api_keys
-        self.current_key_index = 0
-        self.failed_keys = {}  # Track failed keys with timestamp
+        self.labels = {key: key[:10] + "..." for key in api_keys}  # Safe-to-log key prefixes
+        self.failed_keys = {}  # Track failed keys with their cooldown expiry
         self.cooldown_minutes = cooldown_minutes
+        self._cooldown_seconds = cooldown_minutes * 60
+        self._live = deque(api_keys)  # Keys not in cooldown, in rotation order
+        self._cooldown_heap = []  # Min-heap of (expiry, key) for keys in cooldown
         
         if not self.api_keys:
             logger.warning("No GROQ_API_KEYS found in environment variables")
         else:
             logger.info(f"Initialized GroqAPIKeyManager with {len(self.api_keys)} API keys")
     
+    @property
+    def current_key_index(self) -> int:
+        """Index of the key that will be handed out next"""
+        if not self._live:
+            return 0
+        return self.api_keys.index(self._live[0])
+    
+    def _release_expired_keys(self):
+        """Move keys whose cooldown has expired back into rotation"""
+        now = time.monotonic()
+        heap = self._cooldown_heap
+        
+        while heap:
+            expiry, key = heap[0]
+            if self.failed_keys.get(key) != expiry:
+                # Stale entry, the key was failed again with a later expiry
+                heapq.heappop(heap)
+            elif expiry <= now:
+                heapq.heappop(heap)
+                del self.failed_keys[key]
+                self._live.appendleft(key)
+            else:
+                break
+    
     def get_available_key(self) -> Optional[str]:
         """Get an available API key, skipping those in cooldown"""
-        now = datetime.now()
+        self._release_expired_keys()
         
-        # Clean up expired cooldowns
-        self.failed_keys = {
-            key: timestamp 
-            for key, timestamp in self.failed_keys.items()
-            if now - timestamp < timedelta(minutes=self.cooldown_minutes)
-        }
-        
-        # Find an available key
-        for _ in range(len(self.api_keys)):
-            key = self.api_keys[self.current_key_index]
-            
-            if key not in self.failed_keys:
-                return key
-            
-            # Move to next key
-            self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
+        # Round-robin over the keys that are not in cooldown
+        if self._live:
+            key = self._live[0]
+            self._live.rotate(-1)
+            return key
         
         # If all keys are in cooldown, return the least recently failed
-        if self.api_keys:
+        if self._cooldown_heap:
             logger.warning("All API keys are in cooldown, using least recently failed")
-            return self.api_keys[self.current_key_index]
+            return self._cooldown_heap[0][1]
         
         return None
     
     def mark_key_failed(self, api_key: str):
         """Mark a key as failed (rate limited or quota exceeded)"""
-        self.failed_keys[api_key] = datetime.now()
-        logger.warning(f"Marked API key as failed: {api_key[:10]}... (cooldown: {self.cooldown_minutes}m)")
+        expiry = time.monotonic() + self._cooldown_seconds
         
-        # Move to next key
-        self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
+        try:
+            self._live.remove(api_key)
+        except ValueError:
+            pass  # Already in cooldown
+        
+        self.failed_keys[api_key] = expiry
+        heapq.heappush(self._cooldown_heap, (expiry, api_key))
+        logger.warning(f"Marked API key as failed: {self.labels.get(api_key)} (cooldown: {self.cooldown_minutes}m)")
     
     def rotate_to_next_key(self):
         """Manually rotate to the next key"""
-        if len(self.api_keys) > 1:
-            self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
+        if len(self._live) > 1:
+            self._live.rotate(-1)
             logger.info(f"Rotated to next API key (index: {self.current_key_index})")
     
     def get_status(self) -> dict:
         """Get the status of all API keys"""
+        self._release_expired_keys()
         return {
             "total_keys": len(self.api_keys),
             "current_key_index": self.current_key_index,
             "failed_keys_count": len(self.failed_keys),
             "cooldown_minutes": self.cooldown_minutes,
-            "has_available_keys": self.get_available_key() is not None
+            "has_available_keys": bool(self.api_keys)
         }
-
@@ -1,8 +1,9 @@
 """
 Application configuration settings
 """
+from functools import cached_property
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 import os
 
 
@@ -19,6 +20,22 @@ class Settings(BaseSettings):
     groq_timeout: float = 60.0
     groq_max_tokens: int = 2000
     groq_temperature: float = 0.7
+    groq_cache_enabled: bool = True  # Reuse completions for identical prompts
+    groq_cache_size: int = 512
+    groq_cache_ttl_seconds: int = 3600
+    
+    # HTTP Client Settings
+    http_connect_retries: int = 2
+    
+    # Discovery Settings
+    discovery_concurrency: int = 20
+    discovery_cache_size: int = 512  # Pages whose extracted jobs are reused
+    discovery_cache_ttl_seconds: int = 3600
+    
+    # PDF Settings
+    pdf_max_workers: Optional[int] = None  # PDF render processes, defaults to CPU count
+    pdf_store_size: int = 256  # Generated PDF pairs kept for download
+    pdf_store_ttl_seconds: int = 900
     
     # API Key Manager Settings
     api_key_cooldown_minutes: int = 5
@@ -31,7 +48,7 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = False
     
-    @property
+    @cached_property
     def groq_api_keys_list(self) -> List[str]:
         """Parse comma-separated API keys"""
         return [key.strip() for key in self.groq_api_keys.split(",") if key.strip()]
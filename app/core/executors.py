@@ -0,0 +1,56 @@
+"""
+Shared process pool for CPU-bound work (PDF rendering)
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from app.core.config import settings
+
+
+# Shared pool, created on startup (or first use) and shut down on application shutdown
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_pdf_executor() -> ProcessPoolExecutor:
+    """
+    Get the PDF rendering process pool, creating it on first use
+    
+    Workers need no initializer: the PDF modules register their fonts when
+    a spawned worker imports them for its first render.
+    
+    Returns:
+        The shared process pool
+    """
+    global _pdf_executor
+    if _pdf_executor is None:
+        # ReportLab is pure Python, so separate processes render in parallel.
+        # Workers are spawned rather than forked: the server is already
+        # multi-threaded, and a forked child can inherit locks held by other threads.
+        _pdf_executor = ProcessPoolExecutor(
+            max_workers=settings.pdf_max_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pdf_executor
+
+
+def discard_pdf_executor(executor: ProcessPoolExecutor):
+    """
+    Drop a broken PDF process pool so the next get_pdf_executor() builds a new one
+    
+    A ProcessPoolExecutor stays broken once a worker dies (OOM kill, crash).
+    
+    Args:
+        executor: The pool that raised BrokenProcessPool; ignored if it was already replaced
+    """
+    global _pdf_executor
+    if _pdf_executor is executor:
+        _pdf_executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pdf_executor():
+    """Shut down the PDF process pool, waiting for running renders"""
+    global _pdf_executor
+    if _pdf_executor is not None:
+        _pdf_executor.shutdown(wait=True, cancel_futures=True)
+        _pdf_executor = None
@@ -0,0 +1,65 @@
+"""
+Shared HTTP clients for outbound requests (Groq API and page crawls)
+"""
+import httpx
+from typing import Optional
+from app.core.config import settings
+
+
+# Base URL of Groq's OpenAI-compatible API
+GROQ_API_BASE_URL = "https://api.groq.com/openai/v1"
+
+# Shared clients, created on first use and closed on application shutdown
+_http_client: Optional[httpx.AsyncClient] = None
+_groq_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client used for page crawls, creating it on first use"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            # HTTP/2 lets concurrent requests to one host share a connection
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=settings.http_connect_retries,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            ),
+            timeout=settings.groq_timeout
+        )
+    return _http_client
+
+
+def get_groq_client() -> httpx.AsyncClient:
+    """
+    Get the Groq API client, creating it on first use
+    
+    Groq calls get their own connection pool so a discovery run's crawls
+    never hold the connections CV tailoring is waiting for. Requests use
+    paths relative to GROQ_API_BASE_URL and are sent as JSON.
+    """
+    global _groq_client
+    if _groq_client is None:
+        _groq_client = httpx.AsyncClient(
+            base_url=GROQ_API_BASE_URL,
+            headers={"Content-Type": "application/json"},
+            # HTTP/2 multiplexes concurrent Groq calls over one connection
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=settings.http_connect_retries,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+            ),
+            timeout=settings.groq_timeout
+        )
+    return _groq_client
+
+
+async def close_http_client():
+    """Close the shared HTTP clients and release their connections"""
+    global _http_client, _groq_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    if _groq_client is not None:
+        await _groq_client.aclose()
+        _groq_client = None
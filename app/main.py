@@ -1,9 +1,12 @@
 """
 FastAPI application main entry point
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.executors import get_pdf_executor, shutdown_pdf_executor
+from app.core.http import get_http_client, get_groq_client, close_http_client
 from app.core.logging import setup_logging
 from app.api.v1.api import api_router
 
@@ -11,11 +14,24 @@ from app.api.v1.api import api_router
 # Setup logging
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown"""
+    app.state.http_client = get_http_client()
+    app.state.groq_client = get_groq_client()
+    get_pdf_executor()
+    yield
+    await close_http_client()
+    shutdown_pdf_executor()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
-    description="Job scraping and CV tailoring API with AI-powered customization"
+    description="Job scraping and CV tailoring API with AI-powered customization",
+    lifespan=lifespan
 )
 
 # CORS middleware
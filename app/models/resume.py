@@ -1,11 +1,16 @@
 """
 Resume data models for structured resume handling
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional
 
 
-class PersonalInfo(BaseModel):
+class ResumeModel(BaseModel):
+    """Base for resume models: immutable, since parsed resumes are cached and shared"""
+    model_config = ConfigDict(frozen=True)
+
+
+class PersonalInfo(ResumeModel):
     """Personal information section"""
     name: str
     portfolio: Optional[str] = None
@@ -14,13 +19,13 @@ class PersonalInfo(BaseModel):
     linkedin: Optional[str] = None
 
 
-class EmploymentRole(BaseModel):
+class EmploymentRole(ResumeModel):
     """A role within an employment period"""
     title: str
     bullets: List[str]
 
 
-class Employment(BaseModel):
+class Employment(ResumeModel):
     """Employment entry"""
     company: str
     position: str
@@ -29,14 +34,14 @@ class Employment(BaseModel):
     roles: List[EmploymentRole]
 
 
-class Project(BaseModel):
+class Project(ResumeModel):
     """Project entry"""
     name: str
     url: Optional[str] = None
     bullets: List[str]
 
 
-class Education(BaseModel):
+class Education(ResumeModel):
     """Education entry"""
     degree: str
     institution: str
@@ -44,7 +49,7 @@ class Education(BaseModel):
     cgpa: Optional[str] = None
 
 
-class ResumeData(BaseModel):
+class ResumeData(ResumeModel):
     """Complete resume data structure"""
     personal: PersonalInfo
     summary: str
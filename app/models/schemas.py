@@ -2,7 +2,7 @@
 Pydantic models for request/response validation
 """
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 
 class JobSearchRequest(BaseModel):
@@ -14,7 +14,7 @@ class JobSearchRequest(BaseModel):
     hours_old: int = 72
     is_remote: bool = True
     country_indeed: str = "USA"
-    experience_level: Optional[str] = None
+    experience_level: Optional[Literal["entry", "mid", "senior"]] = None
 
 
 class TailorCVRequest(BaseModel):
@@ -35,8 +35,8 @@ class JobSearchResponse(BaseModel):
 class TailorCVResponse(BaseModel):
     """CV tailoring response schema"""
     success: bool
-    cv_pdf: str
-    cover_letter_pdf: str
+    cv_pdf_url: str  # Root-relative download path, valid for PDF_STORE_TTL_SECONDS
+    cover_letter_pdf_url: str
     cv_text: str
     cover_letter_text: str
     job_title: str
@@ -0,0 +1,48 @@
+"""
+In-memory cache of Groq completions, keyed by prompt
+"""
+import hashlib
+from typing import Optional
+from cachetools import TTLCache
+from app.core.config import settings
+
+
+# Raw response bodies of successful completions
+_cache: TTLCache = TTLCache(maxsize=settings.groq_cache_size, ttl=settings.groq_cache_ttl_seconds)
+
+
+def make_cache_key(system_prompt: str, prompt: str) -> str:
+    """
+    Build the cache key for a completion request
+    
+    The model and sampling settings are part of the key, so changing them
+    does not return completions generated with the old values.
+    
+    Args:
+        system_prompt: System prompt
+        prompt: User prompt
+        
+    Returns:
+        Hex digest identifying the request
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        settings.groq_model,
+        str(settings.groq_temperature),
+        str(settings.groq_max_tokens),
+        system_prompt,
+        prompt
+    ):
+        digest.update(part.encode())
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def get_cached_response(key: str) -> Optional[bytes]:
+    """Get a cached response body, or None if missing or expired"""
+    return _cache.get(key)
+
+
+def cache_response(key: str, body: bytes):
+    """Store the body of a successful completion response"""
+    _cache[key] = body
@@ -7,16 +7,24 @@ This service:
 3. Crawls pages and extracts structured job data using AI
 """
 import asyncio
-import json
+import codecs
+import heapq
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from urllib.parse import urlparse, urljoin
 
-import httpx
-from bs4 import BeautifulSoup
+import lxml.html
+import orjson
+from cachetools import TTLCache
 from duckduckgo_search import DDGS
+from fastapi import HTTPException
+from lxml import etree
 
+from app.core.api_key_manager import RATE_LIMIT_STATUS_CODES
 from app.core.config import settings
+from app.core.http import get_http_client, get_groq_client
 from app.core.logging import get_logger
 from app.models.discovery import DiscoveredJob, DiscoverJobsRequest
 
@@ -46,6 +54,61 @@ EXCLUDED_DOMAINS = [
     'dice.com',
 ]
 
+# Precompiled matchers for is_valid_career_url
+_CAREER_PAGE_RE = re.compile("|".join(CAREER_PAGE_PATTERNS))
+_CAREER_KEYWORD_RE = re.compile(r"career|job|hiring|join|work")
+
+# Page blocks whose leading text looks like a job listing. Whole words only,
+# so "International", "Internet" or "Apply filters" don't mark boilerplate as jobs
+_JOB_SECTION_RE = re.compile(
+    r"\b(?:engineer|developer|responsibilit)"
+    r"|\bintern(?:s|ships?)?\b"
+    r"|\broles?\b"
+    r"|\b(?:apply (?:now|for|today)|how to apply)\b",
+    re.IGNORECASE
+)
+_JOB_SECTION_TAGS = ('section', 'article', 'li', 'div')
+
+# Maximum characters of job-relevant text kept per page
+MAX_JOB_SECTION_CHARS = 6000
+
+# Headers sent when crawling career pages
+CRAWL_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+}
+
+# Maximum concurrent crawls against a single host
+MAX_CRAWLS_PER_HOST = 2
+
+# Maximum bytes of HTML downloaded per crawled page
+MAX_CRAWL_BYTES = 256 * 1024
+
+# Number of crawled pages sent to the LLM in a single extraction call
+EXTRACTION_BATCH_SIZE = 3
+
+# Seconds an extraction worker waits for more pages before sending a partial batch
+EXTRACTION_BATCH_WAIT = 0.2
+
+# Number of concurrent extraction workers
+EXTRACTION_WORKERS = 2
+
+# Maximum concurrent DuckDuckGo searches
+MAX_CONCURRENT_SEARCHES = 3
+
+# DDGS is synchronous; searches get their own threads so they never queue
+# behind PDF rendering and HTML parsing in the default executor
+_search_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SEARCHES, thread_name_prefix="ddg-search")
+
+# Crawls in flight, keyed by normalized URL, so concurrent requests share them
+_inflight_crawls: dict[str, asyncio.Future] = {}
+
+# Jobs extracted from each page, keyed by (normalized URL, role), so repeated
+# discoveries skip the crawl and the LLM call for pages seen recently
+_extraction_cache: TTLCache = TTLCache(
+    maxsize=settings.discovery_cache_size,
+    ttl=settings.discovery_cache_ttl_seconds
+)
+
 
 async def generate_search_queries(
     role: str,
@@ -96,34 +159,36 @@ Include queries like:
 Return JSON array of strings only."""
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": settings.groq_model,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    "temperature": 0.7,
-                    "max_tokens": 500
-                }
-            )
-            
-            if response.status_code == 200:
-                content = response.json()["choices"][0]["message"]["content"]
-                # Parse JSON from response
-                queries = json.loads(content)
-                if isinstance(queries, list):
-                    # Add custom terms
-                    queries.extend(custom_terms)
-                    return queries[:10]  # Cap at 10 queries
-            
-            logger.warning(f"LLM query generation failed: {response.status_code}")
+        response = await get_groq_client().post(
+            "/chat/completions",
+            headers={"Authorization": f"Bearer {api_key}"},
+            content=orjson.dumps({
+                "model": settings.groq_model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                "temperature": 0.7,
+                "max_tokens": 500
+            }),
+            timeout=30.0
+        )
+        
+        # A rate-limited key must reach the endpoint so it can retry with another key
+        _raise_for_rate_limit(response)
+        
+        if response.status_code == 200:
+            content = orjson.loads(response.content)["choices"][0]["message"]["content"]
+            # Parse JSON from response
+            queries = orjson.loads(content)
+            if isinstance(queries, list):
+                # Add custom terms
+                queries.extend(custom_terms)
+                return queries[:10]  # Cap at 10 queries
+        
+        logger.warning(f"LLM query generation failed: {response.status_code}")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error generating queries: {e}")
     
@@ -140,6 +205,13 @@ Return JSON array of strings only."""
     return basic_queries
 
 
+def _raise_for_rate_limit(response) -> None:
+    """Raise an HTTPException for Groq rate limit, quota and overload responses"""
+    if response.status_code in RATE_LIMIT_STATUS_CODES:
+        logger.warning(f"Groq rate limit/quota error: {response.status_code}")
+        raise HTTPException(status_code=response.status_code, detail=response.text)
+
+
 def is_valid_career_url(url: str) -> bool:
     """Check if URL is likely a career page and not an excluded domain."""
     try:
@@ -147,25 +219,27 @@ def is_valid_career_url(url: str) -> bool:
         domain = parsed.netloc.lower()
         
         # Exclude job aggregators
-        for excluded in EXCLUDED_DOMAINS:
-            if excluded in domain:
-                return False
+        if any(excluded in domain for excluded in EXCLUDED_DOMAINS):
+            return False
         
-        # Check for career page patterns
+        # Check for career page patterns, or job-related keywords
         full_url = url.lower()
-        for pattern in CAREER_PAGE_PATTERNS:
-            if re.search(pattern, full_url):
-                return True
-        
-        # Also accept if it has job-related keywords
-        if any(kw in full_url for kw in ['career', 'job', 'hiring', 'join', 'work']):
-            return True
-            
-        return False
+        return bool(_CAREER_PAGE_RE.search(full_url) or _CAREER_KEYWORD_RE.search(full_url))
     except:
         return False
 
 
+def normalize_url(url: str) -> str:
+    """Canonical form of a URL for deduplication: no query/fragment, lowercase host, no trailing slash."""
+    parsed = urlparse(url)
+    return f"{parsed.scheme.lower()}://{parsed.netloc.lower()}{parsed.path.rstrip('/')}"
+
+
+def _ddg_search(query: str) -> list[dict]:
+    """Run a blocking DuckDuckGo text search (called on the search threads)"""
+    return DDGS().text(query, max_results=10)
+
+
 async def discover_career_pages(queries: list[str], max_results: int) -> list[str]:
     """
     Search the web for career pages using DuckDuckGo.
@@ -177,40 +251,70 @@ async def discover_career_pages(queries: list[str], max_results: int) -> list[st
     Returns:
         List of career page URLs
     """
-    discovered_urls = set()
+    discovered_urls = {}  # Normalized URL -> first URL seen for it
     
-    try:
-        ddgs = DDGS()
-        
-        for query in queries:
-            if len(discovered_urls) >= max_results:
-                break
-                
+    # DDGS is synchronous, so run each search on the dedicated search threads;
+    # the semaphore keeps the number of in-flight searches polite
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+    loop = asyncio.get_running_loop()
+    
+    async def search(query: str) -> list[dict]:
+        async with semaphore:
             logger.info(f"Searching: {query}")
-            
             try:
-                # Search with DuckDuckGo
-                results = ddgs.text(query, max_results=10)
-                
-                for result in results:
-                    url = result.get('href', '')
-                    if url and is_valid_career_url(url):
-                        discovered_urls.add(url)
-                        
-                        if len(discovered_urls) >= max_results:
-                            break
-                            
+                return await loop.run_in_executor(_search_executor, _ddg_search, query)
             except Exception as e:
                 logger.warning(f"Search error for '{query}': {e}")
-                continue
-                
-            # Small delay between queries to be respectful
-            await asyncio.sleep(0.5)
+                return []
+    
+    tasks = [asyncio.create_task(search(query)) for query in queries]
+    
+    try:
+        for next_results in asyncio.as_completed(tasks):
+            for result in await next_results:
+                url = result.get('href', '')
+                if url and is_valid_career_url(url):
+                    # Different queries often surface the same page
+                    discovered_urls.setdefault(normalize_url(url), url)
+                    
+                    if len(discovered_urls) >= max_results:
+                        break
+            
+            if len(discovered_urls) >= max_results:
+                break
             
     except Exception as e:
         logger.error(f"Discovery error: {e}")
+    finally:
+        # Stop any searches still pending once we have enough URLs
+        for task in tasks:
+            task.cancel()
     
-    return list(discovered_urls)[:max_results]
+    return list(discovered_urls.values())[:max_results]
+
+
+async def crawl_page_shared(url: str) -> Optional[str]:
+    """
+    Crawl a webpage, sharing the result with concurrent crawls of the same page.
+    
+    Discovery requests running at the same time often hit the same career
+    pages; only the first caller fetches, the others await its result.
+    
+    Args:
+        url: URL to crawl
+        
+    Returns:
+        Cleaned text content or None if failed
+    """
+    key = normalize_url(url)
+    task = _inflight_crawls.get(key)
+    if task is None:
+        task = asyncio.ensure_future(crawl_page(url))
+        _inflight_crawls[key] = task
+        task.add_done_callback(lambda _: _inflight_crawls.pop(key, None))
+    
+    # Shield the shared crawl so a cancelled caller does not cancel it for the others
+    return await asyncio.shield(task)
 
 
 async def crawl_page(url: str, timeout: int = 30) -> Optional[str]:
@@ -225,40 +329,156 @@ async def crawl_page(url: str, timeout: int = 30) -> Optional[str]:
         Cleaned text content or None if failed
     """
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
+        async with get_http_client().stream(
+            "GET",
+            url,
+            headers=CRAWL_HEADERS,
             follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            }
-        ) as client:
-            response = await client.get(url)
-            
+            timeout=timeout
+        ) as response:
             if response.status_code != 200:
                 logger.warning(f"Failed to crawl {url}: {response.status_code}")
                 return None
             
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Remove script and style elements
-            for element in soup(['script', 'style', 'nav', 'footer', 'header']):
-                element.decompose()
-            
-            # Get text content
-            text = soup.get_text(separator='\n', strip=True)
-            
-            # Limit text length for LLM
-            if len(text) > 15000:
-                text = text[:15000]
-            
-            return text
+            # lxml does not see the HTTP headers, so pass the declared charset on
+            encoding = response.charset_encoding or "utf-8"
             
+            # Stop downloading once we have more HTML than we will ever use
+            html = bytearray()
+            async for chunk in response.aiter_bytes():
+                html.extend(chunk)
+                if len(html) >= MAX_CRAWL_BYTES:
+                    break
+        
+        # HTML parsing is CPU-bound, keep it off the event loop
+        text = await asyncio.to_thread(html_to_text, bytes(html), encoding)
+        
+        # Limit text length for LLM
+        if len(text) > 15000:
+            text = text[:15000]
+        
+        return text
+        
     except Exception as e:
         logger.error(f"Crawl error for {url}: {e}")
         return None
 
 
+def html_to_text(html: bytes, encoding: str = "utf-8") -> str:
+    """
+    Extract visible text from an HTML page, one text node per line.
+    
+    Parses with lxml directly (no BeautifulSoup tree) and drops
+    script, style and page chrome elements before collecting text.
+    When some blocks look like job listings only their text is kept,
+    so the extraction prompt is not mostly boilerplate.
+    
+    Args:
+        html: Raw HTML bytes
+        encoding: Charset to decode the bytes with, normally from the
+            response Content-Type (unknown names fall back to UTF-8)
+        
+    Returns:
+        Job-relevant text if found, otherwise all text content;
+        an empty string if the page has no parseable content
+    """
+    if not html.strip():
+        return ""
+    
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        encoding = "utf-8"
+    
+    try:
+        tree = lxml.html.fromstring(html, parser=lxml.html.HTMLParser(encoding=encoding))
+    except etree.ParserError:
+        # Nothing but comments or whitespace
+        return ""
+    
+    # Remove script and style elements (keeping the text that follows them)
+    etree.strip_elements(
+        tree, etree.Comment, 'script', 'style', 'nav', 'footer', 'header',
+        with_tail=False
+    )
+    
+    # Prefer the blocks that look like job listings over page boilerplate
+    sections = _job_section_text(tree)
+    if sections:
+        return sections
+    
+    return _node_text(tree)
+
+
+def _node_text(node) -> str:
+    """Text of an element, one stripped text node per line"""
+    return "\n".join(
+        text for text in (text.strip() for text in node.itertext()) if text
+    )
+
+
+def _leading_text(node, limit: int = 200) -> str:
+    """First `limit` characters of an element's text, without reading the rest"""
+    parts = []
+    size = 0
+    for text in node.itertext():
+        parts.append(text)
+        size += len(text)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
+
+def _text_sizes(tree) -> dict:
+    """Length of each element's itertext(), computed bottom-up in one pass"""
+    sizes = {}
+    # Reverse document order visits every child before its parent
+    for node in reversed(list(tree.iter())):
+        size = len(node.text or "") if isinstance(node.tag, str) else 0
+        for child in node:
+            size += sizes[child] + len(child.tail or "")
+        sizes[node] = size
+    return sizes
+
+
+def _job_section_text(tree) -> str:
+    """
+    Collect the text of page blocks that look like job listings.
+    
+    Blocks are visited in document order. A matching block is kept whole
+    when its text fits in MAX_JOB_SECTION_CHARS; larger blocks (page
+    wrappers) are searched for smaller matching blocks instead. Text sizes
+    are computed for the whole tree in one pass, so nested wrappers are not
+    re-read on the way down.
+    
+    Args:
+        tree: Parsed page with script and chrome elements removed
+        
+    Returns:
+        Job-relevant text up to MAX_JOB_SECTION_CHARS, or an empty string if no block matched
+    """
+    text_sizes = _text_sizes(tree)
+    parts = []
+    size = 0
+    stack = [tree]
+    
+    while stack and size < MAX_JOB_SECTION_CHARS:
+        node = stack.pop()
+        
+        if node.tag in _JOB_SECTION_TAGS and text_sizes[node] <= MAX_JOB_SECTION_CHARS:
+            if _JOB_SECTION_RE.search(_leading_text(node)):
+                text = _node_text(node)
+                if text:
+                    parts.append(text)
+                    size += len(text) + 1
+                continue
+        
+        # Visit children in document order
+        stack.extend(reversed([child for child in node if isinstance(child.tag, str)]))
+    
+    return "\n".join(parts)[:MAX_JOB_SECTION_CHARS]
+
+
 async def extract_jobs_from_content(
     content: str,
     source_url: str,
@@ -277,91 +497,134 @@ async def extract_jobs_from_content(
     Returns:
         List of discovered jobs
     """
-    if not content or len(content) < 100:
-        return []
+    jobs_by_url = await extract_jobs_batch([(source_url, content)], role, api_key)
+    return jobs_by_url.get(source_url, [])
+
+
+async def extract_jobs_batch(
+    pages: list[tuple[str, str]],
+    role: str,
+    api_key: str
+) -> dict[str, list[DiscoveredJob]]:
+    """
+    Use a single LLM call to extract structured job data from several pages.
     
-    system_prompt = """You are a job data extractor. Extract job listings from webpage content.
-Return ONLY valid JSON array. Each job object must have these fields:
+    Args:
+        pages: List of (source_url, page text content) tuples
+        role: Target role to filter for
+        api_key: Groq API key
+        
+    Returns:
+        Dict mapping each source URL to the jobs found on that page
+    """
+    jobs_by_url = {url: [] for url, _ in pages}
+    pages = [(url, content) for url, content in pages if content and len(content) >= 100]
+    if not pages:
+        return jobs_by_url
+    
+    system_prompt = """You are a job data extractor. Extract job listings from the content of one or more numbered webpages.
+Return ONLY a valid JSON object mapping each page number (as a string) to an array of the jobs found on that page.
+Each job object must have these fields:
 - title: job title (string)
 - company: company name (string)
 - location: job location or "Remote" (string or null)
 - description: brief job description (string, max 500 chars)
-- apply_url: application URL if found, otherwise use source_url (string)
+- apply_url: application URL if found, otherwise use that page's URL (string)
 - salary_range: salary if mentioned (string or null)
 - job_type: full-time/part-time/contract (string or null)
 - requirements: list of key requirements (array of strings, max 5)
 - confidence_score: how confident you are this is a real job 0.0-1.0 (number)
 
-Return empty array [] if no relevant jobs found. No explanations."""
+Use an empty array [] for pages with no relevant jobs. No explanations."""
 
-    user_prompt = f"""Extract job listings relevant to "{role}" from this career page content.
-Source URL: {source_url}
+    page_sections = "\n\n".join(
+        f"[{number}] URL={url}\n{content[:12000]}"
+        for number, (url, content) in enumerate(pages, start=1)
+    )
+    
+    user_prompt = f"""Extract job listings relevant to "{role}" from these career pages.
 
-Page Content:
-{content[:12000]}
+Pages:
+{page_sections}
 
-Return JSON array of jobs:"""
+Return JSON object of jobs keyed by page number:"""
 
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": settings.groq_model,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": 2000
-                }
-            )
-            
-            if response.status_code != 200:
-                logger.warning(f"LLM extraction failed: {response.status_code}")
-                return []
-            
-            content = response.json()["choices"][0]["message"]["content"]
-            
-            # Try to parse JSON from response
-            # Handle potential markdown code blocks
-            content = content.strip()
-            if content.startswith("```"):
-                content = re.sub(r'^```\w*\n?', '', content)
-                content = re.sub(r'\n?```$', '', content)
-            
-            jobs_data = json.loads(content)
-            
-            if not isinstance(jobs_data, list):
-                return []
-            
-            jobs = []
-            for job_dict in jobs_data:
-                try:
-                    # Ensure apply_url is set
-                    if not job_dict.get('apply_url'):
-                        job_dict['apply_url'] = source_url
-                    job_dict['source_url'] = source_url
-                    
-                    # Create DiscoveredJob instance
-                    job = DiscoveredJob(**job_dict)
-                    jobs.append(job)
-                except Exception as e:
-                    logger.warning(f"Failed to parse job: {e}")
-                    continue
-            
-            return jobs
-            
-    except json.JSONDecodeError as e:
+        response = await get_groq_client().post(
+            "/chat/completions",
+            headers={"Authorization": f"Bearer {api_key}"},
+            content=orjson.dumps({
+                "model": settings.groq_model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                "temperature": 0.3,
+                "max_tokens": 2000 * len(pages)
+            }),
+            timeout=60.0
+        )
+        
+        _raise_for_rate_limit(response)
+        
+        if response.status_code != 200:
+            logger.warning(f"LLM extraction failed: {response.status_code}")
+            return jobs_by_url
+        
+        content = orjson.loads(response.content)["choices"][0]["message"]["content"]
+        
+        # Try to parse JSON from response
+        # Handle potential markdown code blocks
+        content = content.strip()
+        if content.startswith("```"):
+            newline = content.find("\n")
+            content = content[newline + 1:] if newline != -1 else content[3:]
+            if content.endswith("```"):
+                content = content[:-3].rstrip()
+        
+        jobs_data = orjson.loads(content)
+        
+        if not isinstance(jobs_data, dict):
+            return jobs_by_url
+        
+        for number, (source_url, _) in enumerate(pages, start=1):
+            page_jobs = jobs_data.get(str(number))
+            # Only pages the model answered are cached, including ones with no jobs;
+            # a missing or malformed key is retried by the next discovery
+            if isinstance(page_jobs, list):
+                jobs_by_url[source_url] = _parse_jobs(page_jobs, source_url)
+                _extraction_cache[(normalize_url(source_url), role)] = jobs_by_url[source_url]
+        
+        return jobs_by_url
+        
+    except orjson.JSONDecodeError as e:
         logger.warning(f"JSON parse error: {e}")
-        return []
+        return jobs_by_url
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Extraction error: {e}")
-        return []
+        return jobs_by_url
+
+
+def _parse_jobs(jobs_data: list, source_url: str) -> list[DiscoveredJob]:
+    """Build DiscoveredJob instances from raw LLM job dicts, skipping invalid ones"""
+    jobs = []
+    for job_dict in jobs_data:
+        try:
+            # Ensure apply_url is set
+            if not job_dict.get('apply_url'):
+                job_dict['apply_url'] = source_url
+            job_dict['source_url'] = source_url
+            
+            # Create DiscoveredJob instance
+            job = DiscoveredJob(**job_dict)
+            jobs.append(job)
+        except Exception as e:
+            logger.warning(f"Failed to parse job: {e}")
+            continue
+    
+    return jobs
 
 
 async def discover_jobs(
@@ -403,46 +666,82 @@ async def discover_jobs(
         errors.append("No career pages found for given criteria")
         return [], queries, 0, errors
     
-    # Step 3: Crawl pages and extract jobs (with concurrency limit)
+    # Step 3: Crawl pages and extract jobs (with concurrency limit).
+    # Crawled pages are queued and extracted in small batches, one LLM call per batch.
     all_jobs = []
     sources_crawled = 0
     
-    # Process URLs with limited concurrency
-    semaphore = asyncio.Semaphore(5)  # Max 5 concurrent crawls
+    # Process URLs with limited concurrency, overall and per host
+    semaphore = asyncio.Semaphore(settings.discovery_concurrency)
+    host_semaphores = defaultdict(lambda: asyncio.Semaphore(MAX_CRAWLS_PER_HOST))
+    pages: asyncio.Queue = asyncio.Queue()
     
-    async def process_url(url: str) -> list[DiscoveredJob]:
+    async def crawl_url(url: str) -> Optional[list[DiscoveredJob]]:
         nonlocal sources_crawled
-        async with semaphore:
+        cached_jobs = _extraction_cache.get((normalize_url(url), request.role))
+        if cached_jobs is not None:
+            logger.info(f"Using cached jobs for {url}")
+            sources_crawled += 1
+            return cached_jobs
+        
+        # Wait for the host first, so crawls queued on a busy host hold no global slot
+        async with host_semaphores[urlparse(url).netloc], semaphore:
             logger.info(f"Crawling: {url}")
-            content = await crawl_page(url)
+            content = await crawl_page_shared(url)
+        
+        if content:
+            sources_crawled += 1
+            await pages.put((url, content))
+        else:
+            errors.append(f"Failed to crawl: {url}")
+    
+    async def extraction_worker() -> list[DiscoveredJob]:
+        jobs = []
+        finished = False
+        while not finished:
+            page = await pages.get()
+            if page is None:
+                break
             
-            if content:
-                sources_crawled += 1
-                jobs = await extract_jobs_from_content(
-                    content=content,
-                    source_url=url,
-                    role=request.role,
-                    api_key=api_key
-                )
-                logger.info(f"Extracted {len(jobs)} jobs from {url}")
-                return jobs
-            else:
-                errors.append(f"Failed to crawl: {url}")
-                return []
+            # Collect more pages for this batch, without waiting long for slow crawls
+            batch = [page]
+            while len(batch) < EXTRACTION_BATCH_SIZE:
+                try:
+                    page = await asyncio.wait_for(pages.get(), timeout=EXTRACTION_BATCH_WAIT)
+                except asyncio.TimeoutError:
+                    break
+                if page is None:
+                    finished = True
+                    break
+                batch.append(page)
+            
+            jobs_by_url = await extract_jobs_batch(batch, role=request.role, api_key=api_key)
+            for url, page_jobs in jobs_by_url.items():
+                logger.info(f"Extracted {len(page_jobs)} jobs from {url}")
+                jobs.extend(page_jobs)
+        
+        return jobs
+    
+    workers = [asyncio.create_task(extraction_worker()) for _ in range(EXTRACTION_WORKERS)]
+    
+    # Run all crawl tasks, then tell each extraction worker to stop
+    crawl_results = await asyncio.gather(*[crawl_url(url) for url in urls], return_exceptions=True)
+    for _ in workers:
+        await pages.put(None)
     
-    # Run all crawl tasks
-    tasks = [process_url(url) for url in urls]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    results = await asyncio.gather(*workers, return_exceptions=True)
     
-    for result in results:
+    for result in [*crawl_results, *results]:
+        # A rate-limited key fails the whole attempt, so the endpoint retries with another key
+        if isinstance(result, HTTPException) and result.status_code in RATE_LIMIT_STATUS_CODES:
+            raise result
         if isinstance(result, Exception):
             errors.append(str(result))
         elif isinstance(result, list):
             all_jobs.extend(result)
     
-    # Sort by confidence score and limit results
-    all_jobs.sort(key=lambda j: j.confidence_score, reverse=True)
-    all_jobs = all_jobs[:request.max_results]
+    # Keep the highest-confidence jobs, up to the requested limit
+    all_jobs = heapq.nlargest(request.max_results, all_jobs, key=lambda j: j.confidence_score)
     
     logger.info(f"Discovery complete: {len(all_jobs)} jobs from {sources_crawled} sources")
     
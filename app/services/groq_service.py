@@ -1,11 +1,15 @@
 """
 Groq AI service for CV and cover letter generation
 """
+import asyncio
 import httpx
+import orjson
 from typing import Tuple
 from fastapi import HTTPException
 from app.core.config import settings
+from app.core.http import get_groq_client
 from app.core.logging import get_logger
+from app.services.ai_cache import make_cache_key, get_cached_response, cache_response
 
 
 logger = get_logger(__name__)
@@ -35,7 +39,63 @@ EDUCATION
 B.Tech Computer Science - XYZ University (2020-2022)"""
 
 
-async def call_groq_api(prompt: str, system_prompt: str, api_key: str) -> httpx.Response:
+async def _stream_groq_completion(payload: dict, api_key: str) -> httpx.Response:
+    """
+    Stream a chat completion and collect the content deltas as they arrive
+    
+    Args:
+        payload: Chat completion request body (with "stream" set)
+        api_key: Groq API key
+        
+    Returns:
+        Non-streaming shaped chat completion response, or the error response
+    """
+    async with get_groq_client().stream(
+        "POST",
+        "/chat/completions",
+        headers={"Authorization": f"Bearer {api_key}"},
+        content=orjson.dumps(payload)
+    ) as response:
+        # Errors, and servers that ignore "stream", answer with a plain JSON body
+        if response.status_code != 200 or not response.headers.get("content-type", "").startswith("text/event-stream"):
+            await response.aread()
+            return response
+        
+        # Server-sent events, one "data: {chunk}" line per token batch
+        parts = []
+        done = False
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                done = True
+                break
+            
+            chunk = orjson.loads(data)
+            if "error" in chunk:
+                return httpx.Response(500, content=data, headers={"Content-Type": "application/json"})
+            for choice in chunk.get("choices", ()):
+                content = choice.get("delta", {}).get("content")
+                if content:
+                    parts.append(content)
+    
+    # A stream that stops before [DONE] holds a partial completion
+    if not done:
+        logger.error("Groq stream ended before [DONE]")
+        return httpx.Response(
+            502,
+            content=orjson.dumps({"error": {"message": "Groq stream ended before the completion finished"}}),
+            headers={"Content-Type": "application/json"}
+        )
+    
+    body = orjson.dumps({
+        "choices": [{"message": {"role": "assistant", "content": "".join(parts)}}]
+    })
+    return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+
+async def call_groq_api(prompt: str, system_prompt: str, api_key: str, stream: bool = False) -> httpx.Response:
     """
     Helper function to call Groq API
     
@@ -43,28 +103,62 @@ async def call_groq_api(prompt: str, system_prompt: str, api_key: str) -> httpx.
         prompt: User prompt
         system_prompt: System prompt
         api_key: Groq API key
+        stream: Receive the completion as it is generated instead of as one body
         
     Returns:
-        HTTP response from Groq API
+        HTTP response from Groq API (rebuilt from the cache for repeated prompts,
+        see cache_completion).
+        Streamed completions are returned in the same shape as non-streamed ones.
     """
-    async with httpx.AsyncClient(timeout=settings.groq_timeout) as client:
-        response = await client.post(
-            "https://api.groq.com/openai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "model": settings.groq_model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": settings.groq_temperature,
-                "max_tokens": settings.groq_max_tokens
-            }
+    if settings.groq_cache_enabled:
+        cache_key = make_cache_key(system_prompt, prompt)
+        cached = get_cached_response(cache_key)
+        if cached is not None:
+            logger.info("Using cached Groq response")
+            return httpx.Response(200, content=cached, headers={"Content-Type": "application/json"})
+    
+    payload = {
+        "model": settings.groq_model,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": settings.groq_temperature,
+        "max_tokens": settings.groq_max_tokens
+    }
+    
+    if stream:
+        payload["stream"] = True
+        response = await _stream_groq_completion(payload, api_key)
+    else:
+        response = await get_groq_client().post(
+            "/chat/completions",
+            headers={"Authorization": f"Bearer {api_key}"},
+            content=orjson.dumps(payload)
         )
-        return response
+    
+    return response
+
+
+def cache_completion(prompt: str, system_prompt: str, response: httpx.Response):
+    """
+    Cache a completion for repeated prompts, once its content has been accepted
+    
+    Callers cache only after parsing and validating the content, so a truncated
+    or invalid reply is retried on the next request rather than replayed.
+    
+    Args:
+        prompt: User prompt the completion was requested with
+        system_prompt: System prompt the completion was requested with
+        response: Successful response from call_groq_api
+    """
+    if not settings.groq_cache_enabled:
+        return
+    
+    cache_key = make_cache_key(system_prompt, prompt)
+    # Responses served from the cache are already there; keep their original expiry
+    if get_cached_response(cache_key) is None:
+        cache_response(cache_key, response.content)
 
 
 def create_cv_prompt(cv_template: str, job_title: str, company: str, description: str) -> Tuple[str, str]:
@@ -158,42 +252,58 @@ async def generate_tailored_content(
     """
     logger.info(f"Generating tailored content for {job_title} at {company}")
     
-    # Generate tailored CV
     cv_system_prompt, cv_user_prompt = create_cv_prompt(cv_template, job_title, company, description)
+    cl_system_prompt, cl_user_prompt = create_cover_letter_prompt(cv_template, job_title, company, description)
+    
+    # The CV and cover letter are independent, so request both concurrently.
+    # return_exceptions lets both calls finish before either error is raised.
+    logger.info("Generating tailored CV and cover letter...")
+    cv_response, cl_response = await asyncio.gather(
+        call_groq_api(cv_user_prompt, cv_system_prompt, api_key),
+        call_groq_api(cl_user_prompt, cl_system_prompt, api_key),
+        return_exceptions=True
+    )
     
-    logger.info("Generating tailored CV...")
-    cv_response = await call_groq_api(cv_user_prompt, cv_system_prompt, api_key)
+    # Cancellation is a BaseException, not an Exception; propagate it first
+    # so a cancelled call is never treated as a response
+    for result in (cv_response, cl_response):
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+    
+    # Tailored CV
+    if isinstance(cv_response, BaseException):
+        raise cv_response
     
     if cv_response.status_code != 200:
         error_detail = cv_response.text
         logger.error(f"CV API error (status {cv_response.status_code}): {error_detail}")
         raise HTTPException(status_code=cv_response.status_code, detail=error_detail)
     
-    cv_result = cv_response.json()
+    cv_result = orjson.loads(cv_response.content)
     tailored_cv = cv_result.get("choices", [{}])[0].get("message", {}).get("content", "")
     
     if not tailored_cv:
         raise HTTPException(status_code=500, detail="Empty CV response from AI")
     
+    cache_completion(cv_user_prompt, cv_system_prompt, cv_response)
     logger.info("Successfully generated tailored CV")
     
-    # Generate cover letter
-    cl_system_prompt, cl_user_prompt = create_cover_letter_prompt(cv_template, job_title, company, description)
-    
-    logger.info("Generating cover letter...")
-    cl_response = await call_groq_api(cl_user_prompt, cl_system_prompt, api_key)
+    # Cover letter
+    if isinstance(cl_response, BaseException):
+        raise cl_response
     
     if cl_response.status_code != 200:
         error_detail = cl_response.text
         logger.error(f"Cover letter API error (status {cl_response.status_code}): {error_detail}")
         raise HTTPException(status_code=cl_response.status_code, detail=error_detail)
     
-    cl_result = cl_response.json()
+    cl_result = orjson.loads(cl_response.content)
     cover_letter = cl_result.get("choices", [{}])[0].get("message", {}).get("content", "")
     
     if not cover_letter:
         raise HTTPException(status_code=500, detail="Empty cover letter response from AI")
     
+    cache_completion(cl_user_prompt, cl_system_prompt, cl_response)
     logger.info("Successfully generated cover letter")
     
     return tailored_cv, cover_letter
@@ -1,15 +1,20 @@
 """
 Job scraping service
 """
-from jobspy import scrape_jobs
+import re
 from typing import List, Optional
-import pandas as pd
-import numpy as np
 from app.core.logging import get_logger
 
 
 logger = get_logger(__name__)
 
+# Description filters for each supported experience level
+EXPERIENCE_LEVELS = ("entry", "mid", "senior")
+_EXPERIENCE_PATTERNS = {
+    level: re.compile(f"{re.escape(level)}|0-3 years|entry level", re.IGNORECASE)
+    for level in EXPERIENCE_LEVELS
+}
+
 
 def scrape_job_listings(
     sites: List[str],
@@ -32,11 +37,14 @@ def scrape_job_listings(
         hours_old: Filter jobs posted within this many hours
         is_remote: Filter for remote jobs
         country_indeed: Country for Indeed searches
-        experience_level: Filter by experience level
+        experience_level: Filter by experience level (one of EXPERIENCE_LEVELS)
         
     Returns:
         List of job dictionaries
     """
+    # JobSpy pulls in pandas, import it on first use rather than at startup
+    from jobspy import scrape_jobs
+    
     logger.info(f"Scraping jobs: {search_term} in {location} from {sites}")
     
     jobs_df = scrape_jobs(
@@ -56,16 +64,13 @@ def scrape_job_listings(
     # Filter by experience if needed
     if experience_level:
         logger.info(f"Filtering by experience level: {experience_level}")
-        jobs_df = jobs_df[
-            jobs_df["description"].str.contains(
-                f"{experience_level}|0-3 years|entry level",
-                case=False,
-                na=False
-            )
-        ]
+        pattern = _EXPERIENCE_PATTERNS[experience_level]
+        jobs_df = jobs_df[jobs_df["description"].fillna("").str.contains(pattern)]
 
-    # Replace NaN/infinity with None for JSON compatibility
-    jobs_df = jobs_df.replace([np.nan, np.inf, -np.inf], None)
+    # NaT is not JSON serializable; NaN and infinity are written as null by the
+    # response serializer, so only datetime columns need masking
+    for column in jobs_df.select_dtypes(include=["datetime", "datetimetz"]).columns:
+        jobs_df[column] = jobs_df[column].astype(object).where(jobs_df[column].notna(), None)
 
     jobs_list = jobs_df.to_dict(orient="records")
     
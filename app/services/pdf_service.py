@@ -1,7 +1,9 @@
 """
 PDF generation service
 """
+import html
 from io import BytesIO
+from typing import BinaryIO, Optional
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
@@ -12,43 +14,47 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Styles are read-only during rendering, build them once at import
+_STYLES = getSampleStyleSheet()
+_STYLES.add(ParagraphStyle(
+    name='CustomBody',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    leading=14,
+    spaceBefore=6,
+    spaceAfter=6,
+    alignment=TA_LEFT
+))
+_BODY, _H2, _H3 = _STYLES['CustomBody'], _STYLES['Heading2'], _STYLES['Heading3']
 
-def generate_pdf_from_text(text: str, title: str = "Document") -> BytesIO:
+
+def generate_pdf_from_text(text: str, title: str = "Document", out: Optional[BinaryIO] = None) -> Optional[bytes]:
     """
     Generate a PDF from plain text with professional formatting
     
     Args:
         text: The text content to convert to PDF
         title: Title of the document
+        out: Writable binary file to render into instead of returning bytes
         
     Returns:
-        BytesIO buffer containing the PDF
+        PDF file contents, or None when written to `out`
     """
-    buffer = BytesIO()
+    buffer = out if out is not None else BytesIO()
     doc = SimpleDocTemplate(
         buffer,
         pagesize=letter,
         rightMargin=0.75*inch,
         leftMargin=0.75*inch,
         topMargin=0.75*inch,
-        bottomMargin=0.75*inch
+        bottomMargin=0.75*inch,
+        pageCompression=1,
+        invariant=1  # Deterministic output: same content, same bytes
     )
     
     # Container for the 'Flowable' objects
     elements = []
     
-    # Define styles
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(
-        name='CustomBody',
-        parent=styles['Normal'],
-        fontSize=11,
-        leading=14,
-        spaceBefore=6,
-        spaceAfter=6,
-        alignment=TA_LEFT
-    ))
-    
     # Split text into lines and process
     lines = text.split('\n')
     for line in lines:
@@ -58,25 +64,24 @@ def generate_pdf_from_text(text: str, title: str = "Document") -> BytesIO:
             continue
         
         # Escape special characters for ReportLab
-        line = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        line = html.escape(line, quote=False)
         
         # Detect headers (all caps or specific patterns)
         if line.isupper() and len(line) < 50:
             # Header style
-            p = Paragraph(f'<b>{line}</b>', styles['Heading2'])
+            p = Paragraph(f'<b>{line}</b>', _H2)
         elif line.endswith(':') and len(line) < 50:
             # Sub-header style
-            p = Paragraph(f'<b>{line}</b>', styles['Heading3'])
+            p = Paragraph(f'<b>{line}</b>', _H3)
         else:
             # Normal text
-            p = Paragraph(line, styles['CustomBody'])
+            p = Paragraph(line, _BODY)
         
         elements.append(p)
     
     # Build PDF
     doc.build(elements)
-    buffer.seek(0)
     
     logger.info(f"Generated PDF: {title}")
-    return buffer
+    return buffer.getvalue() if out is None else None
 
@@ -0,0 +1,42 @@
+"""
+Short-lived in-memory store for generated PDFs, served by download endpoints
+"""
+import uuid
+from typing import Optional
+from cachetools import TTLCache
+from app.core.config import settings
+
+
+# PDF id -> {"cv": bytes, "cover_letter": bytes}
+_store: TTLCache = TTLCache(maxsize=settings.pdf_store_size, ttl=settings.pdf_store_ttl_seconds)
+
+
+def store_pdfs(cv_pdf: bytes, cover_letter_pdf: bytes) -> str:
+    """
+    Keep a generated CV and cover letter until they are downloaded or expire
+    
+    Args:
+        cv_pdf: CV PDF file contents
+        cover_letter_pdf: Cover letter PDF file contents
+        
+    Returns:
+        Id to download the PDFs with
+    """
+    pdf_id = uuid.uuid4().hex
+    _store[pdf_id] = {"cv": cv_pdf, "cover_letter": cover_letter_pdf}
+    return pdf_id
+
+
+def get_pdf(pdf_id: str, kind: str) -> Optional[bytes]:
+    """
+    Get a stored PDF
+    
+    Args:
+        pdf_id: Id returned by store_pdfs
+        kind: "cv" or "cover_letter"
+        
+    Returns:
+        PDF file contents, or None if unknown or expired
+    """
+    pdfs = _store.get(pdf_id)
+    return pdfs.get(kind) if pdfs else None
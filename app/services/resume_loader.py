@@ -3,6 +3,7 @@ Resume data loader utility
 Loads resume data from YAML file
 """
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from app.models.resume import ResumeData
 from app.core.logging import get_logger
@@ -10,6 +11,12 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Default path to resume template
 DEFAULT_RESUME_PATH = Path(__file__).parent.parent.parent / "public" / "resume_template.yaml"
 
@@ -28,21 +35,31 @@ def load_resume_from_yaml(file_path: Path = None) -> ResumeData:
         FileNotFoundError: If file doesn't exist
         ValueError: If YAML is invalid or doesn't match schema
     """
-    path = file_path or DEFAULT_RESUME_PATH
+    path = Path(file_path or DEFAULT_RESUME_PATH).resolve()
     
-    if not path.exists():
+    # A single stat() both checks existence and gives the cache key
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"Resume template not found at: {path}")
     
+    # Re-parse only when the file has been modified since it was last loaded
+    return _load_resume_cached(path, mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_resume_cached(path: Path, mtime_ns: int) -> ResumeData:
+    """Parse a resume YAML file, cached by path and modification time"""
     logger.info(f"Loading resume from: {path}")
     
     with open(path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=SafeLoader)
     
     if data is None:
         raise ValueError("Resume YAML file is empty or contains only comments")
     
     try:
-        resume = ResumeData(**data)
+        resume = ResumeData.model_validate(data)
         logger.info(f"Successfully loaded resume for: {resume.personal.name}")
         return resume
     except Exception as e:
@@ -2,7 +2,12 @@
 Styled Resume PDF generation service
 Generates professional PDFs matching the user's original resume styling
 """
+from copy import copy
+from functools import lru_cache
 from io import BytesIO
+from typing import BinaryIO, Optional
+from xml.sax.saxutils import escape, quoteattr
+from reportlab import rl_config
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
@@ -10,7 +15,7 @@ from reportlab.lib.colors import HexColor, black
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, 
-    HRFlowable, ListFlowable, ListItem
+    HRFlowable, ListFlowable, ListItem, Flowable
 )
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
@@ -29,14 +34,14 @@ SECTION_LINE_COLOR = HexColor("#4A86E8")  # Blue section divider
 from pathlib import Path
 FONTS_DIR = Path(__file__).parent.parent.parent / "public" / "fonts"
 
-# Flag to track if fonts are registered
-_fonts_registered = False
+# (regular, bold) font names, set once fonts are registered
+_font_names: Optional[tuple[str, str]] = None
 
 
 def register_fonts():
-    """Register custom fonts with ReportLab"""
-    global _fonts_registered
-    if _fonts_registered:
+    """Register custom fonts with ReportLab (runs once, at import)"""
+    global _font_names
+    if _font_names is not None:
         return
     
     inter_font_path = FONTS_DIR / "inter-var-latin.ttf"
@@ -48,28 +53,30 @@ def register_fonts():
             # Use same file for bold (variable font should handle weight)
             pdfmetrics.registerFont(TTFont('Inter-Bold', str(inter_font_path)))
             logger.info("Successfully registered Inter font")
-            _fonts_registered = True
+            _font_names = ('Inter', 'Inter-Bold')
+            return
         except Exception as e:
             logger.warning(f"Failed to register Inter font: {e}. Falling back to Helvetica.")
     else:
         logger.warning(f"Inter font not found at {inter_font_path}. Using Helvetica.")
+    
+    _font_names = ('Helvetica', 'Helvetica-Bold')
 
 
-def get_font_names():
+def get_font_names() -> tuple[str, str]:
     """Get the font names to use (Inter if available, else Helvetica)"""
-    register_fonts()
-    
-    # Check if Inter was successfully registered
-    try:
-        pdfmetrics.getFont('Inter')
-        return 'Inter', 'Inter-Bold'
-    except KeyError:
-        return 'Helvetica', 'Helvetica-Bold'
+    if _font_names is None:
+        register_fonts()
+    return _font_names
+
+
+def get_styles() -> dict:
+    """Get the shared paragraph styles for the resume"""
+    return STYLES
 
 
-def get_styles():
+def _build_styles(font_regular: str, font_bold: str) -> dict:
     """Define all paragraph styles for the resume"""
-    font_regular, font_bold = get_font_names()
     styles = {}
     
     # Name style - bold, larger
@@ -154,8 +161,6 @@ def get_styles():
         fontSize=10,
         leading=13,
         textColor=black,
-        leftIndent=30,
-        bulletIndent=20,
         spaceAfter=2
     )
     
@@ -203,21 +208,109 @@ def get_styles():
     return styles
 
 
+# Fonts are registered and styles built once, at import; renders only read them
+register_fonts()
+STYLES: dict[str, ParagraphStyle] = _build_styles(*get_font_names())
+
+
+@lru_cache(maxsize=256)
 def create_link(text: str, url: str) -> str:
-    """Create a clickable hyperlink in ReportLab format"""
-    return f'<a href="{url}" color="#0000EE"><u>{text}</u></a>'
+    """Create a clickable hyperlink in ReportLab format, escaping text and URL"""
+    return f'<a href={quoteattr(url)} color="#0000EE"><u>{escape(text)}</u></a>'
+
+
+# Blue underline below section headers, copied for each use
+_SECTION_DIVIDER = HRFlowable(
+    width="100%",
+    thickness=1,
+    color=SECTION_LINE_COLOR,
+    spaceBefore=0,
+    spaceAfter=8
+)
 
 
 def add_section_header(elements: list, title: str, styles: dict):
     """Add a section header with blue underline"""
     elements.append(Paragraph(title, styles['SectionHeader']))
-    elements.append(HRFlowable(
-        width="100%",
-        thickness=1,
-        color=SECTION_LINE_COLOR,
-        spaceBefore=0,
-        spaceAfter=8
-    ))
+    elements.append(copy(_SECTION_DIVIDER))
+
+
+class FastBullet(Flowable):
+    """
+    A line of plain bullet text drawn directly as one text object.
+    
+    Most bullets fit on one line, so this skips Paragraph's markup parsing
+    and line breaking. Text too wide for the frame falls back to a
+    Paragraph with the same style at layout time.
+    """
+    
+    def __init__(self, text: str, style: ParagraphStyle):
+        Flowable.__init__(self)
+        self.text = text
+        self.style = style
+        self._paragraph = None  # Fallback layout for text that needs wrapping
+    
+    def wrap(self, availWidth, availHeight):
+        style = self.style
+        if pdfmetrics.stringWidth(self.text, style.fontName, style.fontSize) <= availWidth:
+            self._paragraph = None
+            self.width, self.height = availWidth, style.leading
+            return self.width, self.height
+        
+        if self._paragraph is None:
+            self._paragraph = Paragraph(escape(self.text), style)
+        self.width, self.height = self._paragraph.wrap(availWidth, availHeight)
+        return self.width, self.height
+    
+    def split(self, availWidth, availHeight):
+        if self._paragraph is None:
+            return []
+        return self._paragraph.split(availWidth, availHeight)
+    
+    def getSpaceBefore(self):
+        return self.style.spaceBefore
+    
+    def getSpaceAfter(self):
+        return self.style.spaceAfter
+    
+    def draw(self):
+        if self._paragraph is not None:
+            self._paragraph.drawOn(self.canv, 0, 0)
+            return
+        
+        # Same text operators as a one-line Paragraph: baseline, font and leading
+        style = self.style
+        if rl_config.paraFontSizeHeightOffset:
+            baseline = self.height - style.fontSize
+        else:
+            baseline = self.height - pdfmetrics.getAscent(style.fontName, style.fontSize)
+        
+        self.canv.setFillColor(style.textColor)
+        text = self.canv.beginText(0, baseline)
+        text.setFont(style.fontName, style.fontSize, style.leading)
+        text.textLine(self.text)
+        self.canv.drawText(text)
+
+
+def _bullet_flowable(bullet: str, style: ParagraphStyle) -> Flowable:
+    """FastBullet for plain text bullets, Paragraph for bullets with markup"""
+    if "<" in bullet or "&" in bullet:
+        return Paragraph(bullet, style)
+    return FastBullet(" ".join(bullet.split()), style)
+
+
+def build_bullet_list(bullets: list, style: ParagraphStyle) -> ListFlowable:
+    """Build an indented "-" bullet list as one flowable"""
+    return ListFlowable(
+        [ListItem(_bullet_flowable(bullet, style)) for bullet in bullets],
+        bulletType='bullet',
+        start='-',
+        leftIndent=40,  # Dash at the old 30pt bullet indent, text just after it
+        bulletDedent=10,
+        bulletOffsetY=-1,  # Keep the dash on the text baseline
+        bulletFontName=style.fontName,
+        bulletFontSize=style.fontSize
+    )
 
 
 def build_personal_section(elements: list, personal, styles: dict):
@@ -254,35 +347,44 @@ def build_employment_section(elements: list, employment_list: list, styles: dict
     """Build the employment history section"""
     add_section_header(elements, "Employment History", styles)
     
+    # Look up styles once, outside the loops
+    title_style = styles['SubsectionTitle']
+    duration_style = styles['Duration']
+    technologies_style = styles['Technologies']
+    role_style = styles['RoleTitle']
+    bullet_style = styles['Bullet']
+    
     for emp in employment_list:
         # Company and position
-        elements.append(Paragraph(f"{emp.position}, {emp.company}", styles['SubsectionTitle']))
+        elements.append(Paragraph(f"{emp.position}, {emp.company}", title_style))
         
         # Duration
-        elements.append(Paragraph(f"Duration: {emp.duration}", styles['Duration']))
+        elements.append(Paragraph(f"Duration: {emp.duration}", duration_style))
         
         # Technologies
         if emp.technologies:
             elements.append(Paragraph(
                 f"Technologies Used: [{emp.technologies}]", 
-                styles['Technologies']
+                technologies_style
             ))
         
         # Roles
         for role in emp.roles:
             # Role title (e.g., "As Full-Time Developer (June 2024 – Present):")
-            elements.append(Paragraph(f"• {role.title}:", styles['RoleTitle']))
+            elements.append(Paragraph(f"• {role.title}:", role_style))
             
             # Bullets for this role
-            for bullet in role.bullets:
-                bullet_text = f"- {bullet}"
-                elements.append(Paragraph(bullet_text, styles['Bullet']))
+            if role.bullets:
+                elements.append(build_bullet_list(role.bullets, bullet_style))
 
 
 def build_projects_section(elements: list, projects_list: list, styles: dict):
     """Build the projects section"""
     add_section_header(elements, "Projects", styles)
     
+    title_style = styles['ProjectTitle']
+    bullet_style = styles['Bullet']
+    
     for project in projects_list:
         # Project name with optional link
         if project.url:
@@ -291,12 +393,11 @@ def build_projects_section(elements: list, projects_list: list, styles: dict):
         else:
             title_text = project.name
         
-        elements.append(Paragraph(title_text, styles['ProjectTitle']))
+        elements.append(Paragraph(title_text, title_style))
         
         # Bullets
-        for bullet in project.bullets:
-            bullet_text = f"- {bullet}"
-            elements.append(Paragraph(bullet_text, styles['Bullet']))
+        if project.bullets:
+            elements.append(build_bullet_list(project.bullets, bullet_style))
 
 
 def build_skills_section(elements: list, skills: str, styles: dict):
@@ -323,17 +424,18 @@ def build_education_section(elements: list, education, styles: dict):
     elements.append(Paragraph(duration_text, styles['Duration']))
 
 
-def generate_styled_resume_pdf(resume_data: ResumeData) -> BytesIO:
+def generate_styled_resume_pdf(resume_data: ResumeData, out: Optional[BinaryIO] = None) -> Optional[bytes]:
     """
     Generate a professionally styled PDF from structured resume data
     
     Args:
         resume_data: Structured resume data
+        out: Writable binary file to render into instead of returning bytes
         
     Returns:
-        BytesIO buffer containing the PDF
+        PDF file contents, or None when written to `out`
     """
-    buffer = BytesIO()
+    buffer = out if out is not None else BytesIO()
     
     doc = SimpleDocTemplate(
         buffer,
@@ -341,11 +443,13 @@ def generate_styled_resume_pdf(resume_data: ResumeData) -> BytesIO:
         rightMargin=0.6*inch,
         leftMargin=0.6*inch,
         topMargin=0.5*inch,
-        bottomMargin=0.5*inch
+        bottomMargin=0.5*inch,
+        pageCompression=1,
+        invariant=1  # Deterministic output: same content, same bytes
     )
     
     elements = []
-    styles = get_styles()
+    styles = STYLES
     
     # Build each section
     build_personal_section(elements, resume_data.personal, styles)
@@ -357,7 +461,6 @@ def generate_styled_resume_pdf(resume_data: ResumeData) -> BytesIO:
     
     # Build the PDF
     doc.build(elements)
-    buffer.seek(0)
     
     logger.info(f"Generated styled resume PDF for: {resume_data.personal.name}")
-    return buffer
+    return buffer.getvalue() if out is None else None
@@ -2,59 +2,35 @@
 Resume tailoring service using Groq AI
 Tailors structured resume data based on job descriptions
 """
-import json
-import httpx
+import re
+import orjson
 from typing import Optional
 from fastapi import HTTPException
-from app.core.config import settings
+from pydantic import ValidationError
 from app.core.logging import get_logger
 from app.models.resume import ResumeData
+from app.services.groq_service import call_groq_api, cache_completion
 
 
 logger = get_logger(__name__)
 
-
-async def call_groq_api(prompt: str, system_prompt: str, api_key: str) -> httpx.Response:
-    """
-    Helper function to call Groq API
-    
-    Args:
-        prompt: User prompt
-        system_prompt: System prompt
-        api_key: Groq API key
-        
-    Returns:
-        HTTP response from Groq API
-    """
-    async with httpx.AsyncClient(timeout=settings.groq_timeout) as client:
-        response = await client.post(
-            "https://api.groq.com/openai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "model": settings.groq_model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": settings.groq_temperature,
-                "max_tokens": settings.groq_max_tokens
-            }
-        )
-        return response
+# Markdown code fence (optionally ```json) at the start or end of an AI response
+_FENCE_RE = re.compile(r"\A\s*```(?:json)?\s*|\s*```\s*\Z")
 
 
-def create_resume_tailoring_prompts(resume_data: ResumeData, job_title: str, company: str, description: str) -> tuple[str, str]:
+def create_resume_tailoring_prompts(resume_json: str, job_title: str, company: str, description: str) -> tuple[str, str]:
     """
     Create prompts for tailoring resume content to a job description
     
+    Args:
+        resume_json: Resume data serialized as JSON
+        job_title: Target job title
+        company: Target company name
+        description: Job description
+        
     Returns:
         Tuple of (system_prompt, user_prompt)
     """
-    resume_json = resume_data.model_dump_json(indent=2)
-    
     system_prompt = """You are an expert resume writer and career coach. Your task is to tailor resume content to match specific job descriptions while maintaining the candidate's authentic experience.
 
 CRITICAL RULES:
@@ -86,15 +62,19 @@ Return the tailored resume as valid JSON with the exact same structure. Only mod
     return system_prompt, user_prompt
 
 
-def create_cover_letter_prompts(resume_data: ResumeData, job_title: str, company: str, description: str) -> tuple[str, str]:
+def create_cover_letter_prompts(resume_json: str, job_title: str, company: str, description: str) -> tuple[str, str]:
     """
     Create prompts for generating a cover letter
     
+    Args:
+        resume_json: Resume data serialized as JSON
+        job_title: Target job title
+        company: Target company name
+        description: Job description
+        
     Returns:
         Tuple of (system_prompt, user_prompt)
     """
-    resume_json = resume_data.model_dump_json(indent=2)
-    
     system_prompt = """You are a professional cover letter writer who creates compelling, personalized cover letters that get interviews."""
 
     user_prompt = f"""Write a professional cover letter for this job application.
@@ -122,7 +102,7 @@ IMPORTANT RULES:
 
 
 async def tailor_resume_content(
-    resume_data: ResumeData,
+    resume_json: str,
     job_title: str,
     company: str,
     description: str,
@@ -132,7 +112,7 @@ async def tailor_resume_content(
     Tailor resume content using Groq AI
     
     Args:
-        resume_data: Original structured resume data
+        resume_json: Original resume data serialized as JSON
         job_title: Target job title
         company: Target company name
         description: Job description
@@ -147,17 +127,18 @@ async def tailor_resume_content(
     logger.info(f"Tailoring resume for {job_title} at {company}")
     
     system_prompt, user_prompt = create_resume_tailoring_prompts(
-        resume_data, job_title, company, description
+        resume_json, job_title, company, description
     )
     
-    response = await call_groq_api(user_prompt, system_prompt, api_key)
+    # Stream the completion, a full resume is the longest response we request
+    response = await call_groq_api(user_prompt, system_prompt, api_key, stream=True)
     
     if response.status_code != 200:
         error_detail = response.text
         logger.error(f"Resume tailoring API error (status {response.status_code}): {error_detail}")
         raise HTTPException(status_code=response.status_code, detail=error_detail)
     
-    result = response.json()
+    result = orjson.loads(response.content)
     content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
     
     if not content:
@@ -166,25 +147,25 @@ async def tailor_resume_content(
     # Parse the JSON response
     try:
         # Clean up the response - remove markdown code blocks if present
-        content = content.strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        content = content.strip()
+        content = _FENCE_RE.sub("", content).strip()
         
-        tailored_data = json.loads(content)
-        tailored_resume = ResumeData(**tailored_data)
+        # Parse and validate in one pass, without an intermediate dict
+        tailored_resume = ResumeData.model_validate_json(content)
+        cache_completion(user_prompt, system_prompt, response)
         logger.info("Successfully tailored resume content")
         return tailored_resume
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse AI response as JSON: {e}")
-        logger.error(f"Response content: {content[:500]}...")
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            logger.error(f"Failed to parse AI response as JSON: {e}")
+            logger.error(f"Response content: {content[:500]}...")
+            raise HTTPException(
+                status_code=500, 
+                detail=f"AI returned invalid JSON format: {str(e)}"
+            )
+        logger.error(f"Failed to validate tailored resume: {e}")
         raise HTTPException(
-            status_code=500, 
-            detail=f"AI returned invalid JSON format: {str(e)}"
+            status_code=500,
+            detail=f"Failed to validate tailored resume structure: {str(e)}"
         )
     except Exception as e:
         logger.error(f"Failed to validate tailored resume: {e}")
@@ -195,7 +176,7 @@ async def tailor_resume_content(
 
 
 async def generate_cover_letter(
-    resume_data: ResumeData,
+    resume_json: str,
     job_title: str,
     company: str,
     description: str,
@@ -205,7 +186,7 @@ async def generate_cover_letter(
     Generate a cover letter using Groq AI
     
     Args:
-        resume_data: Structured resume data
+        resume_json: Resume data serialized as JSON
         job_title: Target job title
         company: Target company name
         description: Job description
@@ -220,7 +201,7 @@ async def generate_cover_letter(
     logger.info(f"Generating cover letter for {job_title} at {company}")
     
     system_prompt, user_prompt = create_cover_letter_prompts(
-        resume_data, job_title, company, description
+        resume_json, job_title, company, description
     )
     
     response = await call_groq_api(user_prompt, system_prompt, api_key)
@@ -230,11 +211,12 @@ async def generate_cover_letter(
         logger.error(f"Cover letter API error (status {response.status_code}): {error_detail}")
         raise HTTPException(status_code=response.status_code, detail=error_detail)
     
-    result = response.json()
+    result = orjson.loads(response.content)
     cover_letter = result.get("choices", [{}])[0].get("message", {}).get("content", "")
     
     if not cover_letter:
         raise HTTPException(status_code=500, detail="Empty cover letter response from AI")
     
+    cache_completion(user_prompt, system_prompt, response)
     logger.info("Successfully generated cover letter")
     return cover_letter
@@ -34,12 +34,10 @@ def main():
     # Step 2: Generate styled resume PDF
     print("\n[2] Generating styled resume PDF...")
     try:
-        pdf_buffer = generate_styled_resume_pdf(resume)
-        
-        # Save to file
+        # Render straight into the output file
         resume_pdf_path = output_dir / "test_resume.pdf"
         with open(resume_pdf_path, "wb") as f:
-            f.write(pdf_buffer.read())
+            generate_styled_resume_pdf(resume, out=f)
         
         print(f"    ✓ Resume PDF saved to: {resume_pdf_path}")
     except Exception as e:
@@ -75,12 +73,10 @@ Phone: {resume.personal.phone}
 """
     
     try:
-        cl_buffer = generate_pdf_from_text(mock_cover_letter, "Cover Letter")
-        
-        # Save to file
+        # Render straight into the output file
         cover_letter_path = output_dir / "test_cover_letter.pdf"
         with open(cover_letter_path, "wb") as f:
-            f.write(cl_buffer.read())
+            generate_pdf_from_text(mock_cover_letter, "Cover Letter", out=f)
         
         print(f"    ✓ Cover letter PDF saved to: {cover_letter_path}")
     except Exception as e:
@@ -0,0 +1,114 @@
+"""
+Tests for the CV tailoring endpoints
+"""
+import asyncio
+import os
+import re
+from concurrent.futures.process import BrokenProcessPool
+
+import httpx
+import orjson
+import pytest
+from cachetools import TTLCache
+from fastapi.testclient import TestClient
+
+import app.core.http as http
+from app.api.deps import get_groq_key_manager
+from app.api.v1.endpoints import cv
+from app.core.api_key_manager import GroqAPIKeyManager
+from app.core.executors import get_pdf_executor, shutdown_pdf_executor
+from app.main import app
+from app.services import ai_cache
+from app.services import pdf_store as pdf_store_module
+from app.services.pdf_store import store_pdfs
+from app.services.resume_loader import load_resume_from_yaml
+
+
+@pytest.fixture
+def pdf_executor():
+    """PDF process pool, shut down after the test"""
+    yield get_pdf_executor()
+    shutdown_pdf_executor()
+
+
+def test_render_pdfs_replaces_broken_pool(pdf_executor):
+    """A pool broken by a dead worker is rebuilt and the render retried"""
+    with pytest.raises(BrokenProcessPool):
+        pdf_executor.submit(os._exit, 1).result()
+
+    resume = load_resume_from_yaml()
+    cv_pdf, cover_letter_pdf = asyncio.run(cv._render_pdfs(resume, "Dear Hiring Manager,", "CoverLetter_Test"))
+
+    assert cv_pdf.startswith(b"%PDF")
+    assert cover_letter_pdf.startswith(b"%PDF")
+    assert get_pdf_executor() is not pdf_executor
+
+
+@pytest.fixture
+def pdf_store(monkeypatch):
+    """Empty PDF store whose clock the test controls"""
+    clock = [0.0]
+    store = TTLCache(maxsize=8, ttl=60, timer=lambda: clock[0])
+    monkeypatch.setattr(pdf_store_module, "_store", store)
+    return clock
+
+
+def test_download_stored_pdfs(pdf_store):
+    """Both download routes serve the stored PDFs as attachments"""
+    pdf_id = store_pdfs(b"%PDF-cv", b"%PDF-cover-letter")
+
+    with TestClient(app) as client:
+        cv_response = client.get(f"/api/v1/tailor-cv/{pdf_id}/cv.pdf")
+        cover_letter_response = client.get(f"/api/v1/tailor-cv/{pdf_id}/cover-letter.pdf")
+
+    assert cv_response.status_code == 200
+    assert cv_response.content == b"%PDF-cv"
+    assert cv_response.headers["content-type"] == "application/pdf"
+    assert cv_response.headers["content-disposition"] == 'attachment; filename="CV.pdf"'
+    assert cover_letter_response.status_code == 200
+    assert cover_letter_response.content == b"%PDF-cover-letter"
+    assert cover_letter_response.headers["content-disposition"] == 'attachment; filename="CoverLetter.pdf"'
+
+
+def test_download_unknown_or_expired_pdf(pdf_store):
+    """Unknown ids and ids past PDF_STORE_TTL_SECONDS are 404s"""
+    pdf_id = store_pdfs(b"%PDF-cv", b"%PDF-cover-letter")
+    pdf_store[0] = 61
+
+    with TestClient(app) as client:
+        assert client.get("/api/v1/tailor-cv/unknown/cv.pdf").status_code == 404
+        assert client.get(f"/api/v1/tailor-cv/{pdf_id}/cv.pdf").status_code == 404
+        assert client.get(f"/api/v1/tailor-cv/{pdf_id}/cover-letter.pdf").status_code == 404
+
+
+def test_tailor_cv_returns_root_relative_download_paths(monkeypatch, pdf_store, pdf_executor):
+    """Download links are paths on the API host, not URLs built from the scheme the app sees"""
+    resume_json = load_resume_from_yaml().model_dump_json()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = orjson.loads(request.content)
+        content = resume_json if body.get("stream") else "Dear Hiring Manager,"
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    monkeypatch.setattr(http, "_groq_client", httpx.AsyncClient(
+        base_url=http.GROQ_API_BASE_URL,
+        transport=httpx.MockTransport(handler)
+    ))
+    monkeypatch.setattr(ai_cache, "_cache", TTLCache(maxsize=8, ttl=60))
+    app.dependency_overrides[get_groq_key_manager] = lambda: GroqAPIKeyManager(["k1"])
+    try:
+        with TestClient(app, base_url="https://api.example.com") as client:
+            response = client.post("/api/v1/tailor-cv", json={
+                "title": "Backend Engineer",
+                "company": "Acme",
+                "description": "Python APIs"
+            })
+            result = response.json()
+            cv_download = client.get(result["cv_pdf_url"])
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert re.fullmatch(r"/api/v1/tailor-cv/[0-9a-f]{32}/cv\.pdf", result["cv_pdf_url"])
+    assert re.fullmatch(r"/api/v1/tailor-cv/[0-9a-f]{32}/cover-letter\.pdf", result["cover_letter_pdf_url"])
+    assert cv_download.content.startswith(b"%PDF")
@@ -0,0 +1,229 @@
+"""
+Tests for the /discover endpoint and discovery service
+"""
+import asyncio
+import re
+
+import httpx
+import orjson
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import app.core.http as http
+from app.api.deps import get_groq_key_manager
+from app.core.api_key_manager import GroqAPIKeyManager
+from app.main import app
+from app.models.discovery import DiscoverJobsRequest
+from app.services import discovery_service
+
+
+@pytest.fixture
+def groq_calls(monkeypatch):
+    """Groq mock that rate-limits key k1, and the Authorization header of every call"""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers["authorization"])
+        if request.headers["authorization"] == "Bearer k1":
+            return httpx.Response(429, json={"error": {"message": "Rate limit reached"}})
+        content = orjson.dumps(["python careers remote"]).decode()
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    monkeypatch.setattr(http, "_groq_client", httpx.AsyncClient(
+        base_url=http.GROQ_API_BASE_URL,
+        transport=httpx.MockTransport(handler)
+    ))
+    # No web search in tests; an empty result ends discovery after query generation
+    monkeypatch.setattr(discovery_service, "_ddg_search", lambda query: [])
+    return calls
+
+
+def test_discover_retries_rate_limited_key(groq_calls):
+    """A 429 from Groq marks the key failed and discovery retries with the next key"""
+    key_manager = GroqAPIKeyManager(["k1", "k2"])
+    app.dependency_overrides[get_groq_key_manager] = lambda: key_manager
+    try:
+        with TestClient(app) as client:
+            response = client.post("/api/v1/discovery/discover", json={"role": "Python Developer"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json()["search_queries_used"] == ["python careers remote"]
+    assert groq_calls == ["Bearer k1", "Bearer k2"]
+    assert "k1" in key_manager.failed_keys
+
+
+def test_crawl_page_uses_header_charset(monkeypatch):
+    """Pages are decoded with the Content-Type charset even without a <meta charset>"""
+    html = "<html><body><p>Software Engineer – Zürich</p></body></html>".encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=html, headers={"Content-Type": "text/html; charset=utf-8"})
+
+    monkeypatch.setattr(http, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    text = asyncio.run(discovery_service.crawl_page("https://example.com/careers"))
+
+    assert text == "Software Engineer – Zürich"
+
+
+def test_html_to_text_comment_only_page():
+    """A page with no elements gives an empty string instead of a parser error"""
+    assert discovery_service.html_to_text(b"<!-- only comment -->") == ""
+
+
+def test_discover_reuses_extracted_jobs(monkeypatch):
+    """A page seen by an earlier discovery for the same role is not crawled or extracted again"""
+    page = "<html><body><section><h2>Senior Python Engineer</h2><p>" + "Build APIs. " * 20 + "</p></section></body></html>"
+    crawls = []
+    extractions = []
+
+    def crawl_handler(request: httpx.Request) -> httpx.Response:
+        crawls.append(str(request.url))
+        return httpx.Response(200, content=page.encode(), headers={"Content-Type": "text/html; charset=utf-8"})
+
+    def groq_handler(request: httpx.Request) -> httpx.Response:
+        body = orjson.loads(request.content)
+        if "search query optimizer" in body["messages"][0]["content"]:
+            content = orjson.dumps(["python careers"]).decode()
+        else:
+            extractions.append(body)
+            content = orjson.dumps({"1": [{
+                "title": "Senior Python Engineer",
+                "company": "Example",
+                "description": "Build APIs",
+                "confidence_score": 0.9,
+            }]}).decode()
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    monkeypatch.setattr(http, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(crawl_handler)))
+    monkeypatch.setattr(http, "_groq_client", httpx.AsyncClient(
+        base_url=http.GROQ_API_BASE_URL,
+        transport=httpx.MockTransport(groq_handler)
+    ))
+    monkeypatch.setattr(discovery_service, "_ddg_search", lambda query: [{"href": "https://example.com/careers/"}])
+    monkeypatch.setattr(discovery_service, "_extraction_cache", discovery_service.TTLCache(maxsize=8, ttl=60))
+
+    request = DiscoverJobsRequest(role="Python Developer")
+
+    async def discover_twice():
+        first = await discovery_service.discover_jobs(request, api_key="k1")
+        second = await discovery_service.discover_jobs(request, api_key="k1")
+        return first, second
+
+    (first_jobs, _, first_sources, _), (second_jobs, _, second_sources, _) = asyncio.run(discover_twice())
+
+    assert [job.title for job in first_jobs] == ["Senior Python Engineer"]
+    assert second_jobs == first_jobs
+    assert first_sources == second_sources == 1
+    assert len(crawls) == 1
+    assert len(extractions) == 1
+
+
+def test_html_to_text_skips_boilerplate_with_job_words():
+    """Blocks that only contain job words inside other words or phrases are not job sections"""
+    html = b"""<html><body>
+        <div>Apply filters to narrow results. International offices. Internet Explorer is not supported.</div>
+        <section><h2>Backend Developer</h2><p>Responsibilities: build and run APIs.</p></section>
+    </body></html>"""
+
+    text = discovery_service.html_to_text(html)
+
+    assert text == "Backend Developer\nResponsibilities: build and run APIs."
+
+
+def test_extract_jobs_batch_caches_only_answered_pages(monkeypatch):
+    """Pages missing from the model's reply, or not given a list, are not cached as having no jobs"""
+    content = orjson.dumps({"1": [], "3": "none"}).decode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    monkeypatch.setattr(http, "_groq_client", httpx.AsyncClient(
+        base_url=http.GROQ_API_BASE_URL,
+        transport=httpx.MockTransport(handler)
+    ))
+    cache = discovery_service.TTLCache(maxsize=8, ttl=60)
+    monkeypatch.setattr(discovery_service, "_extraction_cache", cache)
+    text = "Software Engineer. " * 10
+    pages = [(f"https://example.com/careers/{number}", text) for number in range(1, 4)]
+
+    jobs_by_url = asyncio.run(discovery_service.extract_jobs_batch(pages, "Python Developer", "k1"))
+
+    assert jobs_by_url == {url: [] for url, _ in pages}
+    assert list(cache) == [(discovery_service.normalize_url("https://example.com/careers/1"), "Python Developer")]
+
+
+def _mock_discovery(monkeypatch, urls: list[str], extract) -> None:
+    """Serve one job page at each URL, and answer extraction calls with extract(page_urls)"""
+    page = "<html><body><section><h2>Senior Python Engineer</h2><p>" + "Build APIs. " * 20 + "</p></section></body></html>"
+
+    def crawl_handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=page.encode(), headers={"Content-Type": "text/html; charset=utf-8"})
+
+    def groq_handler(request: httpx.Request) -> httpx.Response:
+        body = orjson.loads(request.content)
+        if "search query optimizer" in body["messages"][0]["content"]:
+            return httpx.Response(200, json={"choices": [{"message": {"content": '["python careers"]'}}]})
+        return extract(re.findall(r"^\[\d+\] URL=(\S+)$", body["messages"][1]["content"], re.MULTILINE))
+
+    monkeypatch.setattr(http, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(crawl_handler)))
+    monkeypatch.setattr(http, "_groq_client", httpx.AsyncClient(
+        base_url=http.GROQ_API_BASE_URL,
+        transport=httpx.MockTransport(groq_handler)
+    ))
+    monkeypatch.setattr(discovery_service, "_ddg_search", lambda query: [{"href": url} for url in urls])
+    monkeypatch.setattr(discovery_service, "_extraction_cache", discovery_service.TTLCache(maxsize=32, ttl=60))
+
+
+def test_discover_extracts_every_page_once_in_batches(monkeypatch):
+    """More pages than EXTRACTION_BATCH_SIZE are split into batches, and each page is extracted once"""
+    urls = [f"https://company{number}.example.com/careers" for number in range(7)]
+    batches = []
+
+    def extract(page_urls: list[str]) -> httpx.Response:
+        batches.append(page_urls)
+        content = orjson.dumps({
+            str(number): [{
+                "title": f"Python Engineer at {url}",
+                "company": "Example",
+                "description": "Build APIs",
+                "confidence_score": 0.9,
+            }]
+            for number, url in enumerate(page_urls, start=1)
+        }).decode()
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    _mock_discovery(monkeypatch, urls, extract)
+    # Every crawl finishes well inside the wait, so batches are only cut by size
+    monkeypatch.setattr(discovery_service, "EXTRACTION_BATCH_WAIT", 2.0)
+
+    jobs, _, sources_crawled, errors = asyncio.run(
+        discovery_service.discover_jobs(DiscoverJobsRequest(role="Python Developer"), api_key="k1")
+    )
+
+    assert sorted(len(batch) for batch in batches) == [1, 3, 3]
+    assert sorted(url for batch in batches for url in batch) == sorted(urls)
+    assert sorted(job.title for job in jobs) == sorted(f"Python Engineer at {url}" for url in urls)
+    assert sources_crawled == 7
+    assert errors == []
+
+
+def test_discover_rate_limited_extraction_does_not_hang(monkeypatch):
+    """A rate limit that stops the extraction workers is raised instead of leaving discovery waiting"""
+    urls = [f"https://company{number}.example.com/careers" for number in range(7)]
+
+    def extract(page_urls: list[str]) -> httpx.Response:
+        return httpx.Response(429, json={"error": {"message": "Rate limit reached"}})
+
+    _mock_discovery(monkeypatch, urls, extract)
+
+    async def discover():
+        request = DiscoverJobsRequest(role="Python Developer")
+        return await asyncio.wait_for(discovery_service.discover_jobs(request, api_key="k1"), timeout=10)
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(discover())
+    assert error.value.status_code == 429
@@ -0,0 +1,99 @@
+"""
+Tests for the Groq API service
+"""
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+import app.core.http as http
+from app.services import groq_service
+
+
+SSE_HEADERS = {"Content-Type": "text/event-stream"}
+
+
+def _completion(content: str) -> httpx.Response:
+    """Non-streaming chat completion response with the given content"""
+    return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+
+def test_generate_tailored_content_propagates_cancellation(monkeypatch):
+    """A cancelled Groq call cancels generate_tailored_content instead of being read as a response"""
+    async def fake_call_groq_api(prompt, system_prompt, api_key, stream=False):
+        if "cover letter" in prompt:
+            raise asyncio.CancelledError()
+        return _completion("Tailored CV")
+
+    monkeypatch.setattr(groq_service, "call_groq_api", fake_call_groq_api)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(groq_service.generate_tailored_content(
+            "Developer", "Acme", "Python", groq_service.DEFAULT_CV_TEMPLATE, "k1"
+        ))
+
+
+def _sse(*events: str) -> bytes:
+    """Server-sent events body with one data line per event"""
+    return "".join(f"data: {event}\n\n" for event in events).encode()
+
+
+def _delta(content: str) -> str:
+    """Streamed chat completion chunk carrying a content delta"""
+    return orjson.dumps({"choices": [{"delta": {"content": content}}]}).decode()
+
+
+def _stream(monkeypatch, response: httpx.Response) -> httpx.Response:
+    """Run _stream_groq_completion against a Groq mock that returns the given response"""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(orjson.loads(request.content))
+        return response
+
+    monkeypatch.setattr(http, "_groq_client", httpx.AsyncClient(
+        base_url=http.GROQ_API_BASE_URL,
+        transport=httpx.MockTransport(handler)
+    ))
+    result = asyncio.run(groq_service._stream_groq_completion({"stream": True}, "k1"))
+    assert requests == [{"stream": True}]
+    return result
+
+
+def test_stream_collects_content_deltas(monkeypatch):
+    """Deltas are joined into a non-streaming shaped completion; comments are skipped"""
+    body = b": keep-alive\n\n" + _sse(_delta('{"summary":'), _delta(' "ok"}'), "[DONE]")
+
+    response = _stream(monkeypatch, httpx.Response(200, content=body, headers=SSE_HEADERS))
+
+    assert response.status_code == 200
+    assert response.json()["choices"][0]["message"]["content"] == '{"summary": "ok"}'
+
+
+def test_stream_error_event_is_an_error_response(monkeypatch):
+    """An error event in the middle of the stream becomes a 500 with the error body"""
+    error = orjson.dumps({"error": {"message": "model overloaded"}}).decode()
+    body = _sse(_delta("partial"), error)
+
+    response = _stream(monkeypatch, httpx.Response(200, content=body, headers=SSE_HEADERS))
+
+    assert response.status_code == 500
+    assert response.json() == {"error": {"message": "model overloaded"}}
+
+
+def test_stream_plain_json_reply_is_returned_as_is(monkeypatch):
+    """A server that ignores "stream" and answers with JSON is passed through"""
+    response = _stream(monkeypatch, _completion("Tailored CV"))
+
+    assert response.status_code == 200
+    assert response.json()["choices"][0]["message"]["content"] == "Tailored CV"
+
+
+def test_stream_without_done_is_an_error_response(monkeypatch):
+    """A stream cut off before [DONE] is not returned as a successful partial completion"""
+    body = _sse(_delta('{"summary":'))
+
+    response = _stream(monkeypatch, httpx.Response(200, content=body, headers=SSE_HEADERS))
+
+    assert response.status_code == 502
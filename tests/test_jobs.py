@@ -0,0 +1,41 @@
+"""
+Tests for the /scrape endpoint
+"""
+import datetime
+
+import numpy as np
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def test_scrape_serializes_dates_urls_and_missing_values(monkeypatch):
+    """Dates stay plain ISO dates, URLs are not escaped and NaN/NaT become null"""
+    jobs_df = pd.DataFrame([
+        {
+            "title": "Backend Engineer",
+            "job_url": "https://example.com/jobs/1",
+            "date_posted": datetime.date(2024, 5, 1),
+            "min_amount": np.nan,
+            "scraped_at": pd.NaT,
+        },
+    ])
+    monkeypatch.setattr("jobspy.scrape_jobs", lambda **kwargs: jobs_df)
+
+    with TestClient(app) as client:
+        response = client.post("/api/v1/scrape", json={})
+
+    assert response.status_code == 200
+    assert '"date_posted":"2024-05-01"' in response.text
+    assert '"job_url":"https://example.com/jobs/1"' in response.text
+    assert response.json() == {
+        "jobs": [{
+            "title": "Backend Engineer",
+            "job_url": "https://example.com/jobs/1",
+            "date_posted": "2024-05-01",
+            "min_amount": None,
+            "scraped_at": None,
+        }],
+        "count": 1,
+    }
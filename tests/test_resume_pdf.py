@@ -0,0 +1,55 @@
+"""
+Tests for the styled resume PDF layout
+"""
+from io import BytesIO
+
+from PyPDF2 import PdfReader
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import ListFlowable, ListItem, Paragraph, SimpleDocTemplate
+
+from app.services.resume_pdf_service import STYLES, FastBullet, build_bullet_list
+
+
+BULLETS = [
+    "Designed modular SaaS architecture",
+    "Built REST APIs with FastAPI and PostgreSQL for a multi-tenant platform that "
+    "serves thousands of customers, with background jobs, caching and audit logging",
+]
+
+
+def _text_positions(flowable) -> list[tuple[float, float, str]]:
+    """Render a flowable on a letter page and return (x, y, text) for each text run"""
+    buffer = BytesIO()
+    SimpleDocTemplate(buffer, pagesize=letter).build([flowable])
+
+    positions = []
+
+    def visit(text, cm, tm, font_dict, font_size):
+        if text.strip():
+            positions.append((round(cm[4] + tm[4], 2), round(cm[5] + tm[5], 2), text.strip()))
+
+    PdfReader(BytesIO(buffer.getvalue())).pages[0].extract_text(visitor_text=visit)
+    return positions
+
+
+def _paragraph_bullet_list(bullets: list) -> ListFlowable:
+    """build_bullet_list laid out with plain Paragraphs, as before FastBullet"""
+    fast = build_bullet_list(bullets, STYLES['Bullet'])
+    return ListFlowable(
+        [ListItem(Paragraph(bullet, STYLES['Bullet'])) for bullet in bullets],
+        bulletType='bullet',
+        start='-',
+        leftIndent=fast._leftIndent,
+        bulletDedent=fast._bulletDedent,
+        bulletOffsetY=fast._bulletOffsetY,
+        bulletFontName=fast._bulletFontName,
+        bulletFontSize=fast._bulletFontSize
+    )
+
+
+def test_fast_bullets_match_paragraph_layout():
+    """Single-line and wrapped FastBullets put every text run where Paragraph does"""
+    fast_list = build_bullet_list(BULLETS, STYLES['Bullet'])
+    assert all(isinstance(item._flowable, FastBullet) for item in fast_list._content)
+
+    assert _text_positions(fast_list) == _text_positions(_paragraph_bullet_list(BULLETS))
@@ -0,0 +1,46 @@
+"""
+Tests for the resume tailoring service
+"""
+import asyncio
+
+import httpx
+import orjson
+import pytest
+from cachetools import TTLCache
+from fastapi import HTTPException
+
+import app.core.http as http
+from app.services import ai_cache
+from app.services.resume_loader import load_resume_from_yaml
+from app.services.resume_tailor_service import tailor_resume_content
+
+
+def test_invalid_completion_is_not_cached(monkeypatch):
+    """An invalid AI reply fails the request but is not replayed to the next identical request"""
+    resume_json = load_resume_from_yaml().model_dump_json()
+    replies = ["{\"personal\": {\"name\": ", resume_json]
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        delta = orjson.dumps({"choices": [{"delta": {"content": replies[len(calls) - 1]}}]}).decode()
+        body = f"data: {delta}\n\ndata: [DONE]\n\n".encode()
+        return httpx.Response(200, content=body, headers={"Content-Type": "text/event-stream"})
+
+    monkeypatch.setattr(http, "_groq_client", httpx.AsyncClient(
+        base_url=http.GROQ_API_BASE_URL,
+        transport=httpx.MockTransport(handler)
+    ))
+    monkeypatch.setattr(ai_cache, "_cache", TTLCache(maxsize=8, ttl=60))
+
+    def tailor():
+        return asyncio.run(tailor_resume_content(resume_json, "Backend Engineer", "Acme", "Python", "k1"))
+
+    with pytest.raises(HTTPException) as error:
+        tailor()
+    assert "invalid JSON" in error.value.detail
+
+    # The retry reaches Groq again, and the valid reply it gets is cached
+    assert tailor().model_dump_json() == resume_json
+    assert tailor().model_dump_json() == resume_json
+    assert len(calls) == 2
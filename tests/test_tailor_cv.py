@@ -5,7 +5,6 @@ Tests PDF generation for CV and Cover Letter
 import httpx
 import asyncio
 import json
-import base64
 from pathlib import Path
 
 async def test_tailor_cv():
@@ -61,20 +60,22 @@ Requirements:
                 output_dir = Path("output")
                 output_dir.mkdir(exist_ok=True)
                 
-                # Save CV PDF
-                if result.get('cv_pdf'):
-                    cv_pdf_data = base64.b64decode(result['cv_pdf'])
+                # Download and save CV PDF
+                if result.get('cv_pdf_url'):
+                    cv_pdf = await client.get(base_url + result['cv_pdf_url'])
+                    cv_pdf.raise_for_status()
                     cv_filename = output_dir / f"CV_{request_data['title'].replace(' ', '_')}.pdf"
                     with open(cv_filename, 'wb') as f:
-                        f.write(cv_pdf_data)
+                        f.write(cv_pdf.content)
                     print(f"\n📄 CV PDF saved to: {cv_filename}")
                 
-                # Save Cover Letter PDF
-                if result.get('cover_letter_pdf'):
-                    cl_pdf_data = base64.b64decode(result['cover_letter_pdf'])
+                # Download and save Cover Letter PDF
+                if result.get('cover_letter_pdf_url'):
+                    cl_pdf = await client.get(base_url + result['cover_letter_pdf_url'])
+                    cl_pdf.raise_for_status()
                     cl_filename = output_dir / f"CoverLetter_{request_data['title'].replace(' ', '_')}.pdf"
                     with open(cl_filename, 'wb') as f:
-                        f.write(cl_pdf_data)
+                        f.write(cl_pdf.content)
                     print(f"📄 Cover Letter PDF saved to: {cl_filename}")
                 
                 # Display text versions